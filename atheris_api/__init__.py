@@ -0,0 +1,3 @@
+# Own imports
+# Imported first, so the startup report covers the whole import chain.
+from .utils import startup  # noqa: F401
@@ -1,3 +1,6 @@
+# Python imports
+import asyncio
+
 # Uvicorn imports
 import uvicorn
 
@@ -19,6 +22,13 @@ from beanie import init_beanie
 from config.base_settings import get_settings
 from config.beanie import db_session as mongo_db_session
 from atheris_api.modules import models, routers
+from atheris_api.modules.file.utils.derivatives import shutdown_executor
+from atheris_api.modules.file.utils.scrubber import FileScrubber
+from atheris_api.modules.product.utils.events import TrackChangeStream
+from atheris_api.utils.paginate import get_count_stats
+from atheris_api.utils.startup import get_report, mark
+
+mark("atheris_api.main")
 
 
 def init_api() -> FastAPI:
@@ -35,11 +45,12 @@ def init_api() -> FastAPI:
         """,
         version="0.1.0",
     )
+    background_tasks = []
     api.add_middleware(
         CORSMiddleware,
         allow_origins=get_settings().ORIGINS.split(","),
         allow_credentials=False,
-        allow_methods=("GET", "POST"),
+        allow_methods=("GET", "POST", "PUT"),
         allow_headers=("Content-Type", "Authorization", "Host", "User-Agent"),
     )
 
@@ -52,13 +63,24 @@ def init_api() -> FastAPI:
         await init_beanie(mongo_db_session.get_database, document_models=[*models])
         for router in routers:
             api.include_router(router, prefix="/api")
+        if get_settings().FILE_SCRUB_ENABLED:
+            background_tasks.append(asyncio.create_task(FileScrubber().run_async()))
+        if get_settings().TRACK_CHANGE_STREAM_ENABLED:
+            background_tasks.append(
+                asyncio.create_task(TrackChangeStream().run_async())
+            )
+        mark("ready")
+        print(get_report())
 
     @api.on_event("shutdown")
     async def shutdown():
         """
         Callback function for the shutdown event
         """
-        ...
+        for task in background_tasks:
+            task.cancel()
+        shutdown_executor()
+        print(f"Count cache stats: {get_count_stats()}")
 
     @api.exception_handler(RequestValidationError)
     async def validation_exception_handler(request, exc):
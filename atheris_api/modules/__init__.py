@@ -1,3 +1,6 @@
+# Own imports
+from atheris_api.utils.startup import mark
+
 # Own imports (Routes)
 from .file.routes import router as file_router
 from .home.routes import router as home_router
@@ -19,3 +22,5 @@ models = [
     *home_models,
     *product_models,
 ]
+
+mark("atheris_api.modules")
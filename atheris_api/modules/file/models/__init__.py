@@ -1,5 +1,9 @@
 from .file import models as file_models
+from .scrub import models as scrub_models
+from .upload import models as upload_models
 
 models = [
     *file_models,
+    *scrub_models,
+    *upload_models,
 ]
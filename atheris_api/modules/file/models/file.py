@@ -1,9 +1,15 @@
+# Python imports
+from typing import List
+
 # Pydantic imports
-from pydantic import Field
+from pydantic import Field, validator
 
 # Beanie imports
 from beanie import Document, Indexed, PydanticObjectId
 
+# Own imports
+from ..schemas.file import FileDerivativeSchema
+
 
 class FileModel(Document):
     _id: PydanticObjectId = Field(default_factory=PydanticObjectId, alias="_id")
@@ -12,10 +18,17 @@ class FileModel(Document):
     )
     md5: Indexed(str, unique=True) = Field(..., description="The md5 hash of the file.")
     ext: str = Field(..., description="File extension.")
+    derivatives: List[FileDerivativeSchema] = Field(
+        default_factory=list, description="Resized variants of the file."
+    )
 
     class Settings:
         name = "files"
 
+    @validator("sha256", "md5", pre=True)
+    def normalize_hash(cls, value: str) -> str:
+        return f"{value}".strip().lower()
+
 
 models = [
     FileModel,
@@ -0,0 +1,51 @@
+# Python imports
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+# Pydantic imports
+from pydantic import Field
+
+# Beanie imports
+from beanie import Document, Indexed, PydanticObjectId
+
+
+class ScrubStatusEnum(Enum):
+    OK = "ok"
+    CORRUPT = "corrupt"
+    MISSING = "missing"
+
+
+class ScrubResultModel(Document):
+    id: PydanticObjectId = Field(default_factory=PydanticObjectId, alias="_id")
+    file: Indexed(PydanticObjectId, unique=True) = Field(
+        ..., description="The checked FileModel."
+    )
+    status: Indexed(str) = Field(..., description="ok, corrupt or missing.")
+    signature: Optional[List[int]] = Field(
+        default=None, description="The (inode, size, mtime) of the checked file."
+    )
+    checked_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "scrubResults"
+
+
+class ScrubCheckpointModel(Document):
+    id: str = Field(..., alias="_id")
+    last_file: Optional[PydanticObjectId] = Field(
+        default=None, description="The last FileModel checked in the current pass."
+    )
+    pass_started_at: Optional[datetime] = Field(default=None)
+    pass_finished_at: Optional[datetime] = Field(default=None)
+    owner: Optional[str] = Field(default=None)
+    lease_until: Optional[datetime] = Field(default=None)
+
+    class Settings:
+        name = "scrubCheckpoints"
+
+
+models = [
+    ScrubResultModel,
+    ScrubCheckpointModel,
+]
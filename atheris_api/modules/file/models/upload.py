@@ -0,0 +1,43 @@
+# Python imports
+from datetime import datetime
+from typing import Dict, Optional
+
+# Pydantic imports
+from pydantic import Field
+
+# PyMongo imports
+from pymongo import IndexModel
+
+# Beanie imports
+from beanie import Document, PydanticObjectId
+
+UPLOAD_SESSION_EXPIRATION = 60 * 60 * 24
+
+
+class UploadSessionModel(Document):
+    id: PydanticObjectId = Field(default_factory=PydanticObjectId, alias="_id")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    filename: str = Field(..., description="Name of the file being uploaded.")
+    content_type: Optional[str] = Field(default=None, description="MIME type.")
+    size: int = Field(..., description="Total size in bytes of the file.")
+    chunks: Dict[str, str] = Field(
+        default_factory=dict,
+        description="The sha256 hash of each received chunk by chunk index.",
+    )
+    chunk_sizes: Dict[str, int] = Field(
+        default_factory=dict,
+        description="The size in bytes of each received chunk by chunk index.",
+    )
+
+    class Settings:
+        name = "uploadSessions"
+        indexes = [
+            IndexModel(
+                [("created_at", 1)], expireAfterSeconds=UPLOAD_SESSION_EXPIRATION
+            ),
+        ]
+
+
+models = [
+    UploadSessionModel,
+]
@@ -3,7 +3,9 @@ from fastapi import APIRouter
 
 # Own imports
 from .file import router as file_router
+from .upload import router as upload_router
 
 router = APIRouter()
 
 router.include_router(file_router)
+router.include_router(upload_router)
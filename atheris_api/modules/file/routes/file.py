@@ -13,3 +13,10 @@ router.add_api_route(
     endpoint=FileRequest().read_slide_async,
     tags=["Slides"],
 )
+
+router.add_api_route(
+    "/upload_slides",
+    methods=["POST"],
+    endpoint=FileRequest().upload_slides_async,
+    tags=["Slides"],
+)
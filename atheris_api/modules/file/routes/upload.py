@@ -0,0 +1,36 @@
+# FastAPI
+from fastapi import APIRouter
+
+
+# Own imports
+from ..services.upload import UploadSessionRequest
+
+router = APIRouter()
+
+router.add_api_route(
+    "/upload_session",
+    methods=["POST"],
+    endpoint=UploadSessionRequest().create_session_async,
+    tags=["Slides"],
+)
+
+router.add_api_route(
+    "/upload_session/{session}",
+    methods=["GET"],
+    endpoint=UploadSessionRequest().get_session_async,
+    tags=["Slides"],
+)
+
+router.add_api_route(
+    "/upload_session/{session}/chunk/{index}",
+    methods=["PUT"],
+    endpoint=UploadSessionRequest().upload_chunk_async,
+    tags=["Slides"],
+)
+
+router.add_api_route(
+    "/upload_session/{session}/commit",
+    methods=["POST"],
+    endpoint=UploadSessionRequest().commit_session_async,
+    tags=["Slides"],
+)
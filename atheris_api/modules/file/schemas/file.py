@@ -1,8 +1,17 @@
-from typing import Optional
+from enum import Enum
+from typing import List, Optional
 from beanie import PydanticObjectId
 from pydantic import BaseModel, Field
 
 
+class FileDerivativeSchema(BaseModel):
+    width: int = Field(..., description="Width in pixels of the derivative.")
+    format: str = Field(..., description="Image format of the derivative.")
+    name: str = Field(..., description="Stored name of the derivative.")
+    sha256: str = Field(..., description="The sha256 hash of the derivative.")
+    size: int = Field(..., description="Size in bytes of the derivative.")
+
+
 class FileSchema(BaseModel):
     id: Optional[PydanticObjectId] = Field(
         default=None,
@@ -12,3 +21,23 @@ class FileSchema(BaseModel):
     sha256: str = Field(..., description="The sha256 hash of the file.")
     md5: str = Field(..., description="The md5 hash of the file.")
     ext: str = Field(..., description="File extension.")
+    derivatives: List[FileDerivativeSchema] = Field(
+        default_factory=list, description="Resized variants of the file."
+    )
+
+
+class FileBatchStatusEnum(str, Enum):
+    CREATED = "created"
+    EXISTS = "exists"
+    DUPLICATE = "duplicate"
+    ERROR = "error"
+
+
+class FileBatchResultSchema(BaseModel):
+    filename: str = Field(..., description="Name of the uploaded file.")
+    status: FileBatchStatusEnum = Field(
+        ...,
+        description="created, exists (already on the server), duplicate (repeated in the batch) or error.",
+    )
+    md5: Optional[str] = Field(default=None, description="The md5 hash of the file.")
+    msg: Optional[str] = Field(default=None, description="Error message.")
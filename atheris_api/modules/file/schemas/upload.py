@@ -0,0 +1,20 @@
+from typing import List
+from beanie import PydanticObjectId
+from pydantic import BaseModel, Field
+
+
+class UploadSessionSchema(BaseModel):
+    id: PydanticObjectId = Field(..., description="Unique identifier for the session")
+    filename: str = Field(..., description="Name of the file being uploaded.")
+    size: int = Field(..., description="Total size in bytes of the file.")
+    received: List[int] = Field(..., description="Indexes of the received chunks.")
+    received_size: int = Field(..., description="Bytes received so far.")
+
+
+class UploadChunkSchema(BaseModel):
+    index: int = Field(..., description="Index of the chunk.")
+    sha256: str = Field(..., description="The sha256 hash of the chunk.")
+    size: int = Field(..., description="Size in bytes of the chunk.")
+    stored: bool = Field(
+        ..., description="False if an identical chunk was already stored."
+    )
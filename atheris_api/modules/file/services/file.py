@@ -1,17 +1,58 @@
+# Python imports
+import os
+from typing import List, Optional
+
 # FastAPI imports
-from fastapi import File, UploadFile
-from fastapi.responses import FileResponse
+from fastapi import File, Query, Request, UploadFile
+from fastapi.responses import Response
 
 # Own imports
+from config.base_settings import get_settings
+from ..schemas.file import FileBatchResultSchema
+from ..utils.batch import FileBatch
+from ..utils.derivatives import select_derivative
 from ..utils.file import FileUploadDirectoryEnum, Files
+from ..utils.response import (
+    CACHE_CONTROL_IMMUTABLE,
+    accel_redirect_response,
+    etag_matches,
+    file_response,
+    get_etag,
+    not_modified_response,
+)
 
 
 class FileRequest:
-    async def read_slide_async(self, hash: str):
-        path = await Files.get_path_file_async(
-            hash=hash, dir=FileUploadDirectoryEnum.SLIDES
+    async def read_slide_async(
+        self,
+        request: Request,
+        hash: str,
+        w: Optional[int] = Query(
+            default=None, gt=0, description="Width in pixels the client displays"
+        ),
+    ) -> Response:
+        file = await Files.get_existing_file_async(hash=hash)
+        derivative = select_derivative(
+            derivatives=file.derivatives, width=w, accept=request.headers.get("accept")
+        )
+        etag = get_etag(file.sha256 if derivative is None else derivative.sha256)
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL_IMMUTABLE}
+        if w is not None:
+            headers["Vary"] = "Accept"
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return not_modified_response(headers)
+        path = await Files.get_validated_path_async(
+            file=file, dir=FileUploadDirectoryEnum.SLIDES, derivative=derivative
         )
-        return FileResponse(path)
+        accel_redirect_prefix = get_settings().FILE_ACCEL_REDIRECT_PREFIX
+        if accel_redirect_prefix:
+            return accel_redirect_response(
+                path=path,
+                root=os.path.join(os.getcwd(), "uploads"),
+                prefix=accel_redirect_prefix,
+                headers=headers,
+            )
+        return file_response(path=path, request=request, headers=headers, etag=etag)
 
     async def upload_slide_async(self, file: UploadFile = File(...)):
         files = Files(file=file, dir=FileUploadDirectoryEnum.SLIDES)
@@ -19,3 +60,9 @@ class FileRequest:
         return {
             "upload_dir": file,
         }
+
+    async def upload_slides_async(
+        self, files: List[UploadFile] = File(...)
+    ) -> List[FileBatchResultSchema]:
+        batch = FileBatch(files=files, dir=FileUploadDirectoryEnum.SLIDES)
+        return await batch.save_async()
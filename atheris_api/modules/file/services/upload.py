@@ -0,0 +1,156 @@
+# Python imports
+import os
+
+# Starlette imports
+from starlette.status import (
+    HTTP_201_CREATED,
+    HTTP_404_NOT_FOUND,
+    HTTP_410_GONE,
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+)
+
+# FastAPI imports
+from fastapi import Body, Path, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import HTTPException
+from fastapi.responses import JSONResponse
+
+# Beanie imports
+from beanie import PydanticObjectId
+
+# Own imports
+from config.base_settings import get_settings
+from ..models.upload import UploadSessionModel
+from ..schemas.upload import UploadChunkSchema, UploadSessionSchema
+from ..utils.chunks import assemble_async, store_chunk_async
+from ..utils.file import FileUploadDirectoryEnum, Files, get_storage
+
+MAX_CHUNKS = 10000
+
+
+class UploadSessionRequest:
+    async def _get_session_async(self, session: PydanticObjectId) -> UploadSessionModel:
+        upload_session = await UploadSessionModel.get(document_id=session)
+        if upload_session is None:
+            raise HTTPException(
+                status_code=HTTP_404_NOT_FOUND,
+                detail=[
+                    {
+                        "field": "generalScope",
+                        "msg": "La sesión de carga especificada no existe.",
+                    },
+                ],
+            )
+        return upload_session
+
+    async def create_session_async(
+        self,
+        filename: str = Body(..., description="Name of the file (e.g. banner.png)"),
+        content_type: str = Body(..., description="MIME type (e.g. image/png)"),
+        size: int = Body(..., gt=0, description="Total size in bytes of the file"),
+    ) -> JSONResponse:
+        settings = get_settings()
+        if size > settings.DATA_UPLOAD_MAX_MEMORY_SIZE:
+            raise HTTPException(
+                status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=[
+                    {
+                        "field": "generalScope",
+                        "msg": f"El archivo excede el tamaño máximo permitido de {settings.DATA_UPLOAD_MAX_MEMORY_SIZE} bytes.",
+                    },
+                ],
+            )
+        if not content_type in settings.ALLOWED_MIME_TYPES:
+            raise HTTPException(
+                status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=[
+                    {
+                        "field": "generalScope",
+                        "msg": f"El tipo de archivo no está en la lista de tipos MIME permitidos.",
+                    },
+                ],
+            )
+        upload_session = await UploadSessionModel.insert_one(
+            UploadSessionModel(
+                filename=os.path.basename(filename),
+                content_type=content_type,
+                size=size,
+            )
+        )
+        return JSONResponse(
+            status_code=HTTP_201_CREATED,
+            content={"session": f"{upload_session.id}"},
+        )
+
+    async def get_session_async(self, session: PydanticObjectId) -> UploadSessionSchema:
+        upload_session = await self._get_session_async(session=session)
+        return UploadSessionSchema(
+            id=upload_session.id,
+            filename=upload_session.filename,
+            size=upload_session.size,
+            received=sorted(int(index) for index in upload_session.chunks),
+            received_size=sum(upload_session.chunk_sizes.values()),
+        )
+
+    async def upload_chunk_async(
+        self,
+        request: Request,
+        session: PydanticObjectId,
+        index: int = Path(..., ge=0, lt=MAX_CHUNKS, description="Index of the chunk"),
+    ) -> UploadChunkSchema:
+        upload_session = await self._get_session_async(session=session)
+        sha256, size, stored = await store_chunk_async(request.stream())
+        await UploadSessionModel.find_one(
+            UploadSessionModel.id == upload_session.id
+        ).update(
+            {
+                "$set": {
+                    f"chunks.{index}": sha256,
+                    f"chunk_sizes.{index}": size,
+                }
+            }
+        )
+        return UploadChunkSchema(index=index, sha256=sha256, size=size, stored=stored)
+
+    async def commit_session_async(self, session: PydanticObjectId):
+        upload_session = await self._get_session_async(session=session)
+        storage = get_storage(FileUploadDirectoryEnum.SLIDES)
+        try:
+            staging_path, sha256 = await assemble_async(
+                session=upload_session, storage=storage
+            )
+        except FileNotFoundError:
+            raise HTTPException(
+                status_code=HTTP_410_GONE,
+                detail=[
+                    {
+                        "field": "generalScope",
+                        "msg": "Uno de los fragmentos de la carga ya no está disponible.",
+                    },
+                ],
+            )
+        try:
+            # The same content may already be stored: its md5 is returned
+            # instead of a conflict, so the client can still use it.
+            file = await Files.get_file_async(hash=sha256, md5=False)
+            if file is None:
+                _, ext = os.path.splitext(upload_session.filename)
+                sha256, md5, ext = await Files.commit_staging_async(
+                    staging_path=staging_path, sha256=sha256, ext=ext, storage=storage
+                )
+        finally:
+            await run_in_threadpool(Files._remove_staging_file, staging_path)
+        if file is None:
+            md5 = await Files.save_record_async(
+                sha256=sha256,
+                md5=md5,
+                ext=ext,
+                content_type=upload_session.content_type,
+                storage=storage,
+            )
+        else:
+            md5 = file.md5
+        await upload_session.delete()
+        return {
+            "upload_dir": md5,
+        }
@@ -0,0 +1,148 @@
+# Python imports
+import asyncio
+import hashlib
+from typing import Dict, List, Optional
+
+# PyMongo imports
+from pymongo.errors import BulkWriteError
+
+# FastAPI imports
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import HTTPException
+
+# Own imports
+from config.base_settings import get_settings
+from ..models.file import FileModel
+from ..schemas.file import FileBatchResultSchema, FileBatchStatusEnum
+from .derivatives import create_derivatives_async
+from .file import FileUploadDirectoryEnum, Files, get_storage
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+class FileBatch:
+    """
+    Uploads many files at once: files are staged and hashed with bounded
+    concurrency, duplicates are resolved within the batch and against Mongo
+    with a single $in query, and every new FileModel is written with one
+    insert_many.
+    """
+
+    def __init__(self, files: List[UploadFile], dir: FileUploadDirectoryEnum):
+        self.__files = files
+        self.__dir = dir
+        self.__storage = get_storage(dir)
+        self.__semaphore = asyncio.Semaphore(
+            max(get_settings().FILE_BATCH_CONCURRENCY, 1)
+        )
+
+    @staticmethod
+    def _get_error_message(error: Exception) -> str:
+        if isinstance(error, HTTPException) and isinstance(error.detail, list):
+            return error.detail[0].get("msg")
+        return "No fue posible cargar el archivo."
+
+    async def _stage_async(self, file: UploadFile) -> dict:
+        async with self.__semaphore:
+            files = Files(file=file, dir=self.__dir)
+            try:
+                files._validate_file_size
+                files._validate_file_mimetype
+                staging_path, sha256, ext = await files.stage_async()
+            except Exception as e:
+                return {"error": self._get_error_message(e)}
+        return {
+            "staging_path": staging_path,
+            "sha256": sha256,
+            "md5": hashlib.md5(f"{sha256}".encode()).hexdigest(),
+            "ext": ext,
+        }
+
+    async def _store_async(self, file: UploadFile, staged: dict) -> FileModel:
+        async with self.__semaphore:
+            name = self.__storage.get_name(
+                sha256=staged["sha256"], md5=staged["md5"], ext=staged["ext"]
+            )
+            await run_in_threadpool(self.__storage.commit, staged["staging_path"], name)
+            derivatives = await create_derivatives_async(
+                storage=self.__storage, name=name, content_type=file.content_type
+            )
+        return FileModel(
+            sha256=staged["sha256"],
+            md5=staged["md5"],
+            ext=staged["ext"],
+            derivatives=derivatives,
+        )
+
+    async def save_async(self) -> List[FileBatchResultSchema]:
+        staged_files = await asyncio.gather(
+            *[self._stage_async(file) for file in self.__files]
+        )
+        try:
+            return await self._save_staged_async(staged_files)
+        finally:
+            for staged in staged_files:
+                if "staging_path" in staged:
+                    await run_in_threadpool(
+                        Files._remove_staging_file, staged["staging_path"]
+                    )
+
+    async def _save_staged_async(
+        self, staged_files: List[dict]
+    ) -> List[FileBatchResultSchema]:
+        results: List[Optional[FileBatchResultSchema]] = [None] * len(staged_files)
+        first_by_md5: Dict[str, int] = {}
+        for index, (file, staged) in enumerate(zip(self.__files, staged_files)):
+            if "error" in staged:
+                results[index] = FileBatchResultSchema(
+                    filename=file.filename,
+                    status=FileBatchStatusEnum.ERROR,
+                    msg=staged["error"],
+                )
+            elif staged["md5"] in first_by_md5:
+                results[index] = FileBatchResultSchema(
+                    filename=file.filename,
+                    status=FileBatchStatusEnum.DUPLICATE,
+                    md5=staged["md5"],
+                )
+            else:
+                first_by_md5[staged["md5"]] = index
+        existing = await FileModel.find(
+            {"md5": {"$in": list(first_by_md5.keys())}}
+        ).to_list()
+        for file_model in existing:
+            index = first_by_md5.pop(file_model.md5)
+            results[index] = FileBatchResultSchema(
+                filename=self.__files[index].filename,
+                status=FileBatchStatusEnum.EXISTS,
+                md5=file_model.md5,
+            )
+        indexes = list(first_by_md5.values())
+        new_files = await asyncio.gather(
+            *[
+                self._store_async(self.__files[index], staged_files[index])
+                for index in indexes
+            ]
+        )
+        failed: Dict[int, int] = {}
+        if new_files:
+            try:
+                await FileModel.insert_many(new_files, ordered=False)
+            except BulkWriteError as e:
+                failed = {
+                    error["index"]: error["code"] for error in e.details["writeErrors"]
+                }
+        for position, (index, file_model) in enumerate(zip(indexes, new_files)):
+            results[index] = FileBatchResultSchema(
+                filename=self.__files[index].filename,
+                status=FileBatchStatusEnum.CREATED,
+                md5=file_model.md5,
+            )
+            if failed.get(position) == DUPLICATE_KEY_ERROR:
+                # Another request stored the same content in the meantime.
+                results[index].status = FileBatchStatusEnum.EXISTS
+            elif position in failed:
+                results[index].status = FileBatchStatusEnum.ERROR
+                results[index].msg = "No fue posible cargar el archivo."
+        return results
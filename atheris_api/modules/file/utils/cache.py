@@ -0,0 +1,81 @@
+# Python imports
+from collections import OrderedDict
+from dataclasses import dataclass
+import os
+import threading
+import time
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class VerifiedFile:
+    signature: Tuple[int, int, int]
+    sha256: str
+    verified_at: float
+
+
+class FileVerificationCache:
+    """
+    A bounded LRU cache of files whose content has already been verified.
+
+    Entries are keyed by path and remember the (inode, size, mtime) signature
+    the file had when it was hashed, so a file is only hashed again when it
+    changed on disk or, if an interval is given, when its last verification is
+    older than that interval.
+
+    :param max_size: the maximum number of paths to remember.
+    :param interval: seconds after which a file is verified again even if it
+        did not change. 0 disables periodic verification.
+    """
+
+    def __init__(self, max_size: int, interval: int = 0) -> None:
+        self.__entries: "OrderedDict[str, VerifiedFile]" = OrderedDict()
+        self.__lock = threading.Lock()
+        self.max_size = max_size
+        self.interval = interval
+
+    @staticmethod
+    def get_signature(path: str) -> Tuple[int, int, int]:
+        stat = os.stat(path)
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def is_verified(
+        self, path: str, sha256: str, signature: Tuple[int, int, int]
+    ) -> bool:
+        with self.__lock:
+            entry: Optional[VerifiedFile] = self.__entries.get(path)
+            if entry is None:
+                return False
+            if entry.signature != signature or entry.sha256 != sha256:
+                del self.__entries[path]
+                return False
+            if (
+                self.interval > 0
+                and time.monotonic() - entry.verified_at > self.interval
+            ):
+                del self.__entries[path]
+                return False
+            self.__entries.move_to_end(path)
+            return True
+
+    def add(self, path: str, sha256: str, signature: Tuple[int, int, int]) -> None:
+        if self.max_size < 1:
+            return
+        with self.__lock:
+            self.__entries[path] = VerifiedFile(
+                signature=signature, sha256=sha256, verified_at=time.monotonic()
+            )
+            self.__entries.move_to_end(path)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def discard(self, path: str) -> None:
+        with self.__lock:
+            self.__entries.pop(path, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
@@ -0,0 +1,117 @@
+# Python imports
+import hashlib
+import os
+from typing import AsyncIterator, List, Tuple
+
+# Starlette imports
+from starlette.status import HTTP_409_CONFLICT, HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+# FastAPI imports
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import HTTPException
+
+# Own imports
+from config.base_settings import get_settings
+from ..models.upload import UploadSessionModel
+from .file import FileUploadDirectoryEnum, Files, get_storage
+from .storage import FileStorage
+
+ASSEMBLY_BLOCK_SIZE = 1024 * 1024
+
+
+async def store_chunk_async(stream: AsyncIterator[bytes]) -> Tuple[str, int, bool]:
+    """
+    Streams a chunk into the content-addressed chunk store, hashing it while
+    it is written. A chunk that is already stored is not written twice.
+
+    :param stream: the request body.
+    :return: a tuple with the sha256 of the chunk, its size and whether it was
+        written (False if an identical chunk already existed).
+    """
+    storage = get_storage(FileUploadDirectoryEnum.CHUNKS)
+    max_size = get_settings().FILE_UPLOAD_MAX_CHUNK_SIZE
+    staging_path = await run_in_threadpool(storage.get_staging_path)
+    sha256_hash = hashlib.sha256()
+    size = 0
+    try:
+        buffer = await run_in_threadpool(open, staging_path, "wb")
+        try:
+            async for block in stream:
+                size += len(block)
+                if size > max_size:
+                    raise HTTPException(
+                        status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=[
+                            {
+                                "field": "generalScope",
+                                "msg": f"El fragmento excede el tamaño máximo permitido de {max_size} bytes.",
+                            },
+                        ],
+                    )
+                await run_in_threadpool(Files._write_block, buffer, sha256_hash, block)
+        finally:
+            await run_in_threadpool(buffer.close)
+        sha256 = sha256_hash.hexdigest()
+        if await run_in_threadpool(storage.resolve_path, sha256) is not None:
+            return (sha256, size, False)
+        await run_in_threadpool(storage.commit, staging_path, sha256)
+        return (sha256, size, True)
+    finally:
+        await run_in_threadpool(Files._remove_staging_file, staging_path)
+
+
+def get_chunk_order(session: UploadSessionModel) -> List[str]:
+    """
+    Returns the hashes of the chunks of a session in order, checking that no
+    chunk is missing and that they add up to the declared size.
+    """
+    count = len(session.chunks)
+    if sorted(session.chunks.keys(), key=int) != [f"{i}" for i in range(count)] or (
+        sum(session.chunk_sizes.values()) != session.size
+    ):
+        raise HTTPException(
+            status_code=HTTP_409_CONFLICT,
+            detail=[
+                {
+                    "field": "generalScope",
+                    "msg": "La carga aún no ha recibido todos sus fragmentos.",
+                },
+            ],
+        )
+    return [session.chunks[f"{i}"] for i in range(count)]
+
+
+def _assemble(chunks: FileStorage, hashes: List[str], staging_path: str) -> str:
+    sha256_hash = hashlib.sha256()
+    with open(staging_path, "wb") as buffer:
+        for sha256 in hashes:
+            path = chunks.resolve_path(sha256)
+            if path is None:
+                raise FileNotFoundError(sha256)
+            with open(path, "rb") as chunk:
+                for block in iter(lambda: chunk.read(ASSEMBLY_BLOCK_SIZE), b""):
+                    Files._write_block(buffer, sha256_hash, block)
+        buffer.flush()
+        os.fsync(buffer.fileno())
+    return sha256_hash.hexdigest()
+
+
+async def assemble_async(
+    session: UploadSessionModel, storage: FileStorage
+) -> Tuple[str, str]:
+    """
+    Concatenates the stored chunks of a session into a staging file of the
+    destination storage. Chunks were verified when they were received, so they
+    are only read once, while the hash of the whole file is computed.
+
+    :return: a tuple with the staging path and the sha256 of the file.
+    """
+    hashes = get_chunk_order(session)
+    chunks = get_storage(FileUploadDirectoryEnum.CHUNKS)
+    staging_path = await run_in_threadpool(storage.get_staging_path)
+    try:
+        sha256 = await run_in_threadpool(_assemble, chunks, hashes, staging_path)
+    except Exception:
+        await run_in_threadpool(Files._remove_staging_file, staging_path)
+        raise
+    return (staging_path, sha256)
@@ -0,0 +1,152 @@
+# Python imports
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import os
+from typing import Dict, List, Optional, Tuple
+
+# Pillow is optional: without it uploads are stored and served as they are.
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+    ImageOps = None
+
+# Own imports
+from config.base_settings import get_settings
+from ..schemas.file import FileDerivativeSchema
+from .storage import FileStorage
+
+DERIVATIVE_FORMATS: Dict[str, Dict[str, str]] = {
+    "webp": {"pil": "WEBP", "ext": ".webp", "media_type": "image/webp"},
+    "jpeg": {"pil": "JPEG", "ext": ".jpg", "media_type": "image/jpeg"},
+}
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=get_settings().FILE_DERIVATIVE_WORKERS
+        )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def get_derivative_name(name: str, width: int, format: str) -> str:
+    base, _ = os.path.splitext(name)
+    return f"{base}.w{width}{DERIVATIVE_FORMATS[format]['ext']}"
+
+
+def render_derivatives(
+    source: str, targets: List[Tuple[int, str, str]]
+) -> List[Tuple[int, str, str, str, int]]:
+    """
+    Renders the resized variants of an image. It runs in a worker process.
+
+    :param source: the path of the original image.
+    :param targets: a list of (width, format, destination path) to render.
+        Widths that are not smaller than the original are skipped.
+    :return: a list of (width, format, destination path, sha256, size) for
+        every variant written.
+    """
+    rendered = []
+    with Image.open(source) as original:
+        original = ImageOps.exif_transpose(original)
+        for width, format, path in targets:
+            if width >= original.width:
+                continue
+            height = max(round(original.height * width / original.width), 1)
+            image = original.resize((width, height), Image.LANCZOS)
+            if format == "jpeg" and image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            staging_path = f"{path}.part"
+            image.save(staging_path, DERIVATIVE_FORMATS[format]["pil"], quality=82)
+            os.replace(staging_path, path)
+            sha256_hash = hashlib.sha256()
+            with open(path, "rb") as buffer:
+                for block in iter(lambda: buffer.read(65536), b""):
+                    sha256_hash.update(block)
+            rendered.append(
+                (width, format, path, sha256_hash.hexdigest(), os.path.getsize(path))
+            )
+    return rendered
+
+
+async def create_derivatives_async(
+    storage: FileStorage, name: str, content_type: Optional[str]
+) -> List[FileDerivativeSchema]:
+    """
+    Renders the configured widths and formats of a stored image in the process
+    pool and returns them. Failures are not fatal: the original is still served.
+
+    :param storage: the storage the original image was committed to.
+    :param name: the stored name of the original image.
+    :param content_type: the MIME type of the upload.
+    :return: the derivatives written next to the original.
+    """
+    settings = get_settings()
+    if Image is None or not content_type or not content_type.startswith("image/"):
+        return []
+    widths = [
+        int(width) for width in settings.FILE_DERIVATIVE_WIDTHS.split(",") if width
+    ]
+    formats = [
+        format.strip().lower()
+        for format in settings.FILE_DERIVATIVE_FORMATS.split(",")
+        if format.strip().lower() in DERIVATIVE_FORMATS
+    ]
+    targets = [
+        (width, format, storage.get_path(get_derivative_name(name, width, format)))
+        for width in widths
+        for format in formats
+    ]
+    if not targets:
+        return []
+    loop = asyncio.get_running_loop()
+    try:
+        rendered = await loop.run_in_executor(
+            _get_executor(), render_derivatives, storage.get_path(name), targets
+        )
+    except Exception:
+        return []
+    return [
+        FileDerivativeSchema(
+            width=width,
+            format=format,
+            name=os.path.basename(path),
+            sha256=sha256,
+            size=size,
+        )
+        for width, format, path, sha256, size in rendered
+    ]
+
+
+def select_derivative(
+    derivatives: List[FileDerivativeSchema],
+    width: Optional[int],
+    accept: Optional[str],
+) -> Optional[FileDerivativeSchema]:
+    """
+    Picks the smallest derivative at least as wide as the requested width,
+    preferring WebP when the Accept header allows it.
+
+    :return: the chosen derivative, or None to serve the original.
+    """
+    if not derivatives or width is None:
+        return None
+    formats = ["webp", "jpeg"] if "image/webp" in (accept or "") else ["jpeg"]
+    for format in formats:
+        candidates = [d for d in derivatives if d.format == format and d.width >= width]
+        if candidates:
+            return min(candidates, key=lambda d: d.width)
+    return None
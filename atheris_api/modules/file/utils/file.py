@@ -1,10 +1,10 @@
 # Python imports
+from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 import hashlib
 import os
-import re
-import shutil
-import tempfile
+from typing import List, Optional
 
 # Starlette imports
 from starlette.status import (
@@ -17,22 +17,63 @@ from starlette.status import (
 
 # FastAPI imports
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import HTTPException
 
 # Own imports
 from config.base_settings import get_settings
+from atheris_api.utils.cache import TTLCache
 from ..models.file import FileModel
-from ..schemas.file import FileSchema
+from ..models.scrub import ScrubResultModel, ScrubStatusEnum
+from ..schemas.file import FileDerivativeSchema, FileSchema
+from .cache import FileVerificationCache
+from .derivatives import create_derivatives_async
+from .storage import FileStorage
 
 
 class FileUploadDirectoryEnum(Enum):
     SLIDES = ["uploads", "slides"]
+    CHUNKS = ["uploads", "chunks"]
+
+
+@lru_cache
+def get_storage(dir: FileUploadDirectoryEnum) -> FileStorage:
+    settings = get_settings()
+    return FileStorage(
+        dir=dir.value,
+        depth=settings.FILE_STORAGE_SHARD_DEPTH,
+        width=settings.FILE_STORAGE_SHARD_WIDTH,
+    )
+
+
+@lru_cache
+def get_record_cache() -> TTLCache[FileModel]:
+    settings = get_settings()
+    return TTLCache(
+        max_size=settings.FILE_RECORD_CACHE_SIZE, ttl=settings.FILE_RECORD_CACHE_TTL
+    )
+
+
+@lru_cache
+def get_verification_cache() -> FileVerificationCache:
+    settings = get_settings()
+    return FileVerificationCache(
+        max_size=settings.FILE_VERIFICATION_CACHE_SIZE,
+        interval=settings.FILE_VERIFICATION_INTERVAL,
+    )
+
+
+def get_slide_url(md5: str) -> str:
+    """
+    Returns the URL a product slide banner is read from.
+    """
+    return f"/read_slide?hash={md5}"
 
 
 class Files:
     def __init__(self, file: UploadFile, dir: FileUploadDirectoryEnum):
         self.__file = file
-        self.__dir = [*dir.value]
+        self.__storage = get_storage(dir)
 
     @property
     def _validate_file_size(self) -> UploadFile:
@@ -68,42 +109,119 @@ class Files:
 
     @property
     async def _write_file_async(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            file_path = f"{temp_dir}/{self.__file.filename}"
-            sha256_hash = hashlib.sha256()
-            with open(file_path, "wb") as buffer:
-                for block in iter(lambda: self.__file.file.read(4096), b""):
-                    sha256_hash.update(block)
-                    buffer.write(block)
-            md5_hash = hashlib.md5(f"{sha256_hash.hexdigest()}".encode())
-            upload_dir = os.path.join(os.getcwd(), *self.__dir)
-            os.makedirs(upload_dir, exist_ok=True)
-            name, ext = os.path.splitext(self.__file.filename)
-            name = hashlib.md5(
-                f"{sha256_hash.hexdigest()}{md5_hash.hexdigest()}".encode()
-            ).hexdigest()
-            if await self._get_file_by_md5_async(md5=md5_hash.hexdigest()):
-                raise HTTPException(
-                    status_code=HTTP_409_CONFLICT,
-                    detail=[
-                        {
-                            "field": "generalScope",
-                            "msg": f"El archivo ya ha sido cargado anteriormente en el servidor.",
-                        },
-                    ],
-                )
-            with open(f"{upload_dir}/{name}{ext}", "wb") as buffer:
-                with open(file_path, "rb") as temp_buffer:
-                    shutil.copyfileobj(temp_buffer, buffer)
-        return (sha256_hash.hexdigest(), md5_hash.hexdigest(), f"{ext}")
+        staging_path, sha256, ext = await self.stage_async()
+        try:
+            return await self.commit_staging_async(
+                staging_path=staging_path,
+                sha256=sha256,
+                ext=ext,
+                storage=self.__storage,
+            )
+        finally:
+            await run_in_threadpool(self._remove_staging_file, staging_path)
+
+    async def stage_async(self):
+        """
+        Writes the upload to a staging file in the upload directory, so the
+        final rename is atomic and the file is never copied a second time.
+
+        :return: a tuple with the staging path, the sha256 and the extension.
+        """
+        staging_path = await run_in_threadpool(self.__storage.get_staging_path)
+        try:
+            sha256_hash = await self._stream_to_staging_async(staging_path)
+        except BaseException:
+            await run_in_threadpool(self._remove_staging_file, staging_path)
+            raise
+        _, ext = os.path.splitext(self.__file.filename)
+        return (staging_path, sha256_hash.hexdigest(), ext)
+
+    @classmethod
+    async def commit_staging_async(
+        cls, staging_path: str, sha256: str, ext: str, storage: FileStorage
+    ):
+        """
+        Moves a fully written staging file into the store under its
+        content-addressed name, unless the same content was already uploaded.
+
+        :return: a tuple with the sha256, the md5 and the extension of the file.
+        """
+        md5 = hashlib.md5(f"{sha256}".encode()).hexdigest()
+        if await cls._get_file_by_md5_async(self=cls, md5=md5):
+            raise HTTPException(
+                status_code=HTTP_409_CONFLICT,
+                detail=[
+                    {
+                        "field": "generalScope",
+                        "msg": f"El archivo ya ha sido cargado anteriormente en el servidor.",
+                    },
+                ],
+            )
+        name = storage.get_name(sha256=sha256, md5=md5, ext=ext)
+        await run_in_threadpool(storage.commit, staging_path, name)
+        return (sha256, md5, f"{ext}")
+
+    async def _stream_to_staging_async(self, staging_path: str):
+        """
+        Reads the upload in chunks and hashes and writes each chunk in a single
+        pass. Disk and hashing work run in the threadpool so the event loop
+        keeps serving other requests.
+        """
+        chunk_size = get_settings().FILE_UPLOAD_CHUNK_SIZE
+        sha256_hash = hashlib.sha256()
+        await self.__file.seek(0)
+        buffer = await run_in_threadpool(open, staging_path, "wb")
+        try:
+            while block := await self.__file.read(chunk_size):
+                await run_in_threadpool(self._write_block, buffer, sha256_hash, block)
+            await run_in_threadpool(buffer.flush)
+            await run_in_threadpool(os.fsync, buffer.fileno())
+        finally:
+            await run_in_threadpool(buffer.close)
+        return sha256_hash
+
+    @staticmethod
+    def _write_block(buffer, sha256_hash, block: bytes):
+        sha256_hash.update(block)
+        buffer.write(block)
+
+    @staticmethod
+    def _remove_staging_file(staging_path: str):
+        try:
+            os.remove(staging_path)
+        except FileNotFoundError:
+            pass
 
     @property
     async def save_async(self):
         self._validate_file_size
         self._validate_file_mimetype
         sha256, md5, ext = await self._write_file_async
-        return await self._get_md5_async(
-            buffer=FileSchema(sha256=sha256, md5=md5, ext=ext)
+        return await self.save_record_async(
+            sha256=sha256,
+            md5=md5,
+            ext=ext,
+            content_type=self.__file.content_type,
+            storage=self.__storage,
+        )
+
+    @classmethod
+    async def save_record_async(
+        cls,
+        sha256: str,
+        md5: str,
+        ext: str,
+        content_type: Optional[str],
+        storage: FileStorage,
+    ) -> str:
+        derivatives = await create_derivatives_async(
+            storage=storage,
+            name=storage.get_name(sha256=sha256, md5=md5, ext=ext),
+            content_type=content_type,
+        )
+        return await cls._get_md5_async(
+            self=cls,
+            buffer=FileSchema(sha256=sha256, md5=md5, ext=ext, derivatives=derivatives),
         )
 
     @property
@@ -113,31 +231,62 @@ class Files:
         return await FileModel.insert_one(file)
 
     async def _get_file_by_md5_async(self, md5: str):
-        regex_pattern = f"^{re.escape(md5)}$"
-        return await FileModel.find(
-            {"md5": {"$regex": regex_pattern, "$options": "i"}}
-        ).first_or_none()
+        return await FileModel.find_one({"md5": md5.strip().lower()})
 
     async def _get_file_by_sha256_async(self, sha256: str):
-        regex_pattern = f"^{re.escape(sha256)}$"
-        return await FileModel.find(
-            {"sha256": {"$regex": regex_pattern, "$options": "i"}}
-        ).first_or_none()
+        return await FileModel.find_one({"sha256": sha256.strip().lower()})
 
     async def _get_md5_async(self, buffer: FileSchema):
-        file = FileModel(sha256=buffer.sha256, md5=buffer.md5, ext=buffer.ext)
+        file = FileModel(
+            sha256=buffer.sha256,
+            md5=buffer.md5,
+            ext=buffer.ext,
+            derivatives=buffer.derivatives,
+        )
         await FileModel.insert_one(file)
         return file.md5
 
-    def _validate_file(self, file: FileModel, dir: FileUploadDirectoryEnum):
-        search_path = os.path.join(os.getcwd(), *dir.value)
-        file_path = "{}{}".format(
-            hashlib.md5(f"{file.sha256}{file.md5}".encode()).hexdigest(), file.ext
-        )
-        path = os.path.join(search_path, file_path)
-        if os.path.exists(path=path):
-            if self.get_sha256(path=path) == file.sha256:
+    def _validate_file(
+        self,
+        file: FileModel,
+        dir: FileUploadDirectoryEnum,
+        derivative: Optional[FileDerivativeSchema] = None,
+        trusted_signature: Optional[List[int]] = None,
+        cached_only: bool = False,
+    ):
+        storage = get_storage(dir)
+        if derivative is None:
+            name = storage.get_name(sha256=file.sha256, md5=file.md5, ext=file.ext)
+            sha256 = file.sha256
+        else:
+            name = derivative.name
+            sha256 = derivative.sha256
+        path = storage.resolve_path(name)
+        cache = get_verification_cache()
+        if path is not None:
+            try:
+                signature = cache.get_signature(path)
+            except FileNotFoundError:
+                # The file was moved into the sharded layout after it was resolved.
+                path = storage.get_path(name)
+                try:
+                    signature = cache.get_signature(path)
+                except FileNotFoundError:
+                    # It was also removed (e.g. by the GC) in the meantime.
+                    path = None
+        if path is not None:
+            if cache.is_verified(path=path, sha256=sha256, signature=signature):
+                return path
+            if cached_only:
+                return None
+            if trusted_signature is not None and tuple(trusted_signature) == signature:
+                # A recent scrub hashed this very file and found it intact.
+                cache.add(path=path, sha256=sha256, signature=signature)
+                return path
+            if self.get_sha256(path=path) == sha256:
+                cache.add(path=path, sha256=sha256, signature=signature)
                 return path
+            cache.discard(path)
             raise HTTPException(
                 status_code=HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=[
@@ -159,18 +308,24 @@ class Files:
 
     @classmethod
     async def get_file_async(cls, hash: str, md5: bool = True):
+        key = ("md5" if md5 else "sha256", hash.strip().lower())
+        cache = get_record_cache()
+        file = cache.get(key)
+        if file is not None:
+            return file
         if md5:
-            return await cls._get_file_by_md5_async(self=cls, md5=hash)
+            file = await cls._get_file_by_md5_async(self=cls, md5=hash)
         else:
-            return await cls._get_file_by_sha256_async(self=cls, sha256=hash)
+            file = await cls._get_file_by_sha256_async(self=cls, sha256=hash)
+        if file is not None:
+            cache.set(key, file)
+        return file
 
     @classmethod
-    async def get_path_file_async(
-        cls, hash: str, dir: FileUploadDirectoryEnum, md5: bool = True
-    ):
+    async def get_existing_file_async(cls, hash: str, md5: bool = True) -> FileModel:
         file = await cls.get_file_async(hash=hash, md5=md5)
         if file:
-            return cls._validate_file(self=cls, file=file, dir=dir)
+            return file
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND,
             detail=[
@@ -181,6 +336,54 @@ class Files:
             ],
         )
 
+    @classmethod
+    async def get_validated_path_async(
+        cls,
+        file: FileModel,
+        dir: FileUploadDirectoryEnum,
+        derivative: Optional[FileDerivativeSchema] = None,
+    ) -> str:
+        trusted_signature = None
+        if derivative is None:
+            # The scrub results are only looked up when the file is not in the
+            # verification cache, so cache hits do not query Mongo.
+            path = await run_in_threadpool(
+                cls._validate_file, self=cls, file=file, dir=dir, cached_only=True
+            )
+            if path is not None:
+                return path
+            trusted_signature = await cls._get_trusted_signature_async(
+                self=cls, file=file
+            )
+        return await run_in_threadpool(
+            cls._validate_file,
+            self=cls,
+            file=file,
+            dir=dir,
+            derivative=derivative,
+            trusted_signature=trusted_signature,
+        )
+
+    async def _get_trusted_signature_async(self, file: FileModel):
+        trust = get_settings().FILE_SCRUB_TRUST_SECONDS
+        if trust <= 0:
+            return None
+        result = await ScrubResultModel.find_one(
+            {
+                "file": file.id,
+                "status": ScrubStatusEnum.OK.value,
+                "checked_at": {"$gte": datetime.utcnow() - timedelta(seconds=trust)},
+            }
+        )
+        return result.signature if result else None
+
+    @classmethod
+    async def get_path_file_async(
+        cls, hash: str, dir: FileUploadDirectoryEnum, md5: bool = True
+    ):
+        file = await cls.get_existing_file_async(hash=hash, md5=md5)
+        return await cls.get_validated_path_async(file=file, dir=dir)
+
     @classmethod
     async def get_path_terms_async(cls, hash: str):
         terms = await cls._get_terms_by_md5_async(self=cls, md5=hash)
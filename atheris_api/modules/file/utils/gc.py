@@ -0,0 +1,282 @@
+# Python imports
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+# Motor imports
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+# Beanie imports
+from beanie import PydanticObjectId
+
+# Own imports
+from ..models.file import FileModel
+from ..models.upload import UploadSessionModel
+from .file import FileUploadDirectoryEnum, get_slide_url, get_storage
+from .storage import FileStorage
+
+REPORT_SAMPLE_SIZE = 100
+
+
+class GarbageReport:
+    """
+    Counts what the collector found, keeping a sample of each kind.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = {}
+        self.samples: Dict[str, List[str]] = {}
+
+    def add(self, kind: str, value: str) -> None:
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        sample = self.samples.setdefault(kind, [])
+        if len(sample) < REPORT_SAMPLE_SIZE:
+            sample.append(value)
+
+    def dict(self) -> dict:
+        return {"counts": self.counts, "samples": self.samples}
+
+
+class FileGarbageCollector:
+    """
+    Cross-references the stored files, the files collection and the slide
+    banners in batches, so memory stays bounded whatever their number, and
+    removes what nothing uses any more:
+
+    - FileModel records no slide references (orphan_records).
+    - FileModel records whose file vanished (dangling_records).
+    - Stored files no FileModel accounts for (orphan_files).
+    - Chunks no open upload session uses (orphan_chunks).
+
+    Records and files newer than the grace period are left alone, so an
+    upload whose slide is still being created is never collected. Files are
+    first moved to a quarantine directory and only deleted by a later run,
+    once they have been there for the quarantine period.
+
+    :param dry_run: only report, without touching anything.
+    :param grace: seconds before a record or file can be collected.
+    :param quarantine: seconds a file stays in quarantine before deletion.
+    :param batch: number of records or stored files checked per round trip.
+    """
+
+    def __init__(
+        self,
+        dry_run: bool = True,
+        grace: int = 86400,
+        quarantine: int = 604800,
+        batch: int = 500,
+    ) -> None:
+        self.dry_run = dry_run
+        self.grace = grace
+        self.quarantine = quarantine
+        self.batch = batch
+        self.started_at = time.time()
+        self.report = GarbageReport()
+        self.quarantine_root = os.path.join(os.getcwd(), "uploads", ".quarantine")
+        self.quarantine_dir = os.path.join(
+            self.quarantine_root, f"{int(self.started_at)}"
+        )
+
+    def _is_old(self, timestamp: float) -> bool:
+        return self.started_at - timestamp > self.grace
+
+    def _quarantine(self, storage: FileStorage, path: str) -> None:
+        if self.dry_run:
+            return
+        target = os.path.join(
+            self.quarantine_dir,
+            os.path.relpath(path, os.path.dirname(storage.root)),
+        )
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        try:
+            os.replace(path, target)
+        except FileNotFoundError:
+            pass
+
+    async def _get_referenced_md5s_async(self, md5s: List[str]) -> Set[str]:
+        """
+        Returns which of md5s a slide banner references, with one $in query.
+        """
+        # Local import: the home module depends on this one.
+        from atheris_api.modules.home.models.home import ProductSlideModel
+
+        banners = {get_slide_url(md5): md5 for md5 in md5s}
+        cursor = ProductSlideModel.get_motor_collection().find(
+            {"banner": {"$in": list(banners)}}, {"banner": 1}
+        )
+        return {banners[slide["banner"]] async for slide in cursor}
+
+    def _get_paths(self, storage: FileStorage, file: FileModel) -> List[str]:
+        names = [storage.get_name(sha256=file.sha256, md5=file.md5, ext=file.ext)]
+        names += [derivative.name for derivative in file.derivatives]
+        return [path for path in map(storage.resolve_path, names) if path]
+
+    async def _collect_records_async(
+        self, storage: FileStorage, known_names: AsyncIOMotorCollection
+    ) -> None:
+        """
+        Streams the files collection in _id order and collects orphan and
+        dangling records, checking the banner references of each batch.
+
+        :param known_names: where the names of every stored file that belongs
+            to a record are written, including the orphan records handled here.
+        """
+        last_id: Optional[PydanticObjectId] = None
+        while True:
+            query = {} if last_id is None else {"_id": {"$gt": last_id}}
+            files = await FileModel.find(query).sort("+_id").limit(self.batch).to_list()
+            if not files:
+                return
+            last_id = files[-1].id
+            referenced = await self._get_referenced_md5s_async(
+                [file.md5 for file in files]
+            )
+            names = []
+            collected = []
+            for file in files:
+                name = storage.get_name(sha256=file.sha256, md5=file.md5, ext=file.ext)
+                paths = self._get_paths(storage, file)
+                names += [{"name": os.path.basename(path)} for path in paths]
+                old = self._is_old(file.id.generation_time.timestamp())
+                if old and file.md5 not in referenced:
+                    self.report.add("orphan_records", file.md5)
+                    for path in paths:
+                        self._quarantine(storage, path)
+                    collected.append(file.id)
+                elif old and storage.resolve_path(name) is None:
+                    self.report.add("dangling_records", file.md5)
+                    collected.append(file.id)
+            if names:
+                await known_names.insert_many(names)
+            if collected and not self.dry_run:
+                await FileModel.find({"_id": {"$in": collected}}).delete()
+
+    async def _collect_paths_async(
+        self,
+        storage: FileStorage,
+        paths: List[str],
+        get_known_async: Callable[[List[str]], Awaitable[Set[str]]],
+        kind: str,
+    ) -> None:
+        known = await get_known_async([os.path.basename(path) for path in paths])
+        for path in paths:
+            if os.path.basename(path) in known:
+                continue
+            try:
+                if not self._is_old(os.path.getmtime(path)):
+                    continue
+            except FileNotFoundError:
+                continue
+            self.report.add(kind, os.path.relpath(path, storage.root))
+            self._quarantine(storage, path)
+
+    async def _collect_files_async(
+        self,
+        storage: FileStorage,
+        get_known_async: Callable[[List[str]], Awaitable[Set[str]]],
+        kind: str,
+    ) -> None:
+        """
+        Walks the stored files in batches, asking get_known_async which names
+        of each batch are in use, and collects the rest.
+        """
+        paths: List[str] = []
+        for path in storage.iter_paths():
+            paths.append(path)
+            if len(paths) >= self.batch:
+                await self._collect_paths_async(storage, paths, get_known_async, kind)
+                paths = []
+        if paths:
+            await self._collect_paths_async(storage, paths, get_known_async, kind)
+
+    async def _collect_chunks_async(self) -> None:
+        storage = get_storage(FileUploadDirectoryEnum.CHUNKS)
+        used: Set[str] = set()
+        cursor = UploadSessionModel.get_motor_collection().find(
+            {}, {"chunks": 1}, batch_size=self.batch
+        )
+        # Open sessions are few and short-lived, so their chunks fit in memory.
+        async for upload_session in cursor:
+            used.update(upload_session.get("chunks", {}).values())
+
+        async def get_used_async(names: List[str]) -> Set[str]:
+            return used.intersection(names)
+
+        await self._collect_files_async(storage, get_used_async, "orphan_chunks")
+
+    def _purge_quarantine(self) -> None:
+        if not os.path.isdir(self.quarantine_root):
+            return
+        for entry in os.scandir(self.quarantine_root):
+            if not entry.is_dir() or not entry.name.isdigit():
+                continue
+            if self.started_at - int(entry.name) > self.quarantine:
+                self.report.add("purged_quarantines", entry.name)
+                if not self.dry_run:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+
+    async def run_async(self) -> dict:
+        self._purge_quarantine()
+        storage = get_storage(FileUploadDirectoryEnum.SLIDES)
+        # The names of the stored files that belong to a record are kept in a
+        # scratch collection instead of memory, and looked up per batch.
+        known_names = FileModel.get_motor_collection().database[
+            f"gcKnownNames{int(self.started_at)}"
+        ]
+        try:
+            await known_names.create_index("name")
+            await self._collect_records_async(storage, known_names)
+
+            async def get_known_async(names: List[str]) -> Set[str]:
+                cursor = known_names.find({"name": {"$in": names}}, {"name": 1})
+                return {known["name"] async for known in cursor}
+
+            await self._collect_files_async(storage, get_known_async, "orphan_files")
+        finally:
+            await known_names.drop()
+        await self._collect_chunks_async()
+        return {
+            "dry_run": self.dry_run,
+            "started_at": datetime.utcfromtimestamp(self.started_at).isoformat(),
+            **self.report.dict(),
+        }
+
+
+async def _run_async(args: argparse.Namespace) -> dict:
+    # Local imports: initializing Beanie needs every module's models.
+    from beanie import init_beanie
+    from config.beanie import db_session as mongo_db_session
+    from atheris_api.modules import models
+
+    mongo_db_session.init()
+    await init_beanie(mongo_db_session.get_database, document_models=[*models])
+    collector = FileGarbageCollector(
+        dry_run=not args.apply,
+        grace=int(timedelta(hours=args.grace_hours).total_seconds()),
+        quarantine=int(timedelta(days=args.quarantine_days).total_seconds()),
+    )
+    return await collector.run_async()
+
+
+def start():
+    parser = argparse.ArgumentParser(
+        prog="gcuploads",
+        description="Reports, quarantines and deletes uploads nothing references.",
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Quarantine and delete. Without it only a dry-run report is printed.",
+    )
+    parser.add_argument("--grace-hours", type=float, default=24)
+    parser.add_argument("--quarantine-days", type=float, default=7)
+    args = parser.parse_args()
+    try:
+        print(json.dumps(asyncio.run(_run_async(args)), indent=2))
+    except Exception as e:
+        print(e)
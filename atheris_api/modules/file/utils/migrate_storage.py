@@ -0,0 +1,69 @@
+# Python imports
+import argparse
+import time
+from typing import List
+
+# Own imports
+from .file import FileUploadDirectoryEnum, get_storage
+from .storage import FileStorage
+
+
+class StorageMigration:
+    """
+    Moves files stored with the flat layout into the sharded layout while the
+    API keeps serving them.
+
+    Each batch is first hard linked into its sharded path, so readers find the
+    file under either path. The flat paths are only removed after a grace
+    period, once requests that resolved them have had time to open the file.
+    """
+
+    def __init__(self, storage: FileStorage, batch: int, grace: float) -> None:
+        self.__storage = storage
+        self.__batch = max(batch, 1)
+        self.__grace = max(grace, 0)
+
+    def _migrate_batch(self, names: List[str]) -> int:
+        linked = [name for name in names if self.__storage.link_legacy_file(name)]
+        if linked:
+            time.sleep(self.__grace)
+        for name in linked:
+            self.__storage.remove_legacy_file(name)
+        return len(linked)
+
+    def migrate(self) -> int:
+        if self.__storage.depth == 0:
+            return 0
+        moved = 0
+        names: List[str] = []
+        for name in self.__storage.iter_legacy_names():
+            names.append(name)
+            if len(names) >= self.__batch:
+                moved += self._migrate_batch(names)
+                names = []
+        if names:
+            moved += self._migrate_batch(names)
+        return moved
+
+
+def start():
+    parser = argparse.ArgumentParser(
+        prog="migratestorage",
+        description="Moves uploaded files from the flat layout into the sharded layout.",
+    )
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument(
+        "--grace",
+        type=float,
+        default=5.0,
+        help="Seconds to keep both paths of a batch before removing the flat one.",
+    )
+    args = parser.parse_args()
+    for dir in FileUploadDirectoryEnum:
+        migration = StorageMigration(
+            storage=get_storage(dir), batch=args.batch, grace=args.grace
+        )
+        try:
+            print(f"{dir.name}: {migration.migrate()} files migrated.")
+        except Exception as e:
+            print(e)
@@ -0,0 +1,205 @@
+# Python imports
+import mimetypes
+import os
+import re
+import uuid
+from urllib.parse import quote
+from typing import AsyncIterator, List, Mapping, Optional, Tuple
+
+# AnyIO imports
+import anyio
+
+# Starlette imports
+from starlette.status import (
+    HTTP_206_PARTIAL_CONTENT,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+)
+
+# FastAPI imports
+from fastapi import Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+CACHE_CONTROL_IMMUTABLE = "public, max-age=31536000, immutable"
+MAX_RANGES = 16
+CHUNK_SIZE = 64 * 1024
+
+RANGE_SPEC_REGEX = re.compile(r"^\s*(\d*)\s*-\s*(\d*)\s*$")
+
+
+def get_etag(sha256: str) -> str:
+    """
+    Returns a strong ETag for a content-addressed file.
+
+    :param sha256: the sha256 hash stored for the file.
+    :return: the quoted ETag value.
+    """
+    return f'"{sha256}"'
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """
+    Returns whether an If-None-Match header matches the given ETag, using the
+    weak comparison RFC 9110 requires for that header.
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag in tags
+
+
+def not_modified_response(headers: Mapping[str, str]) -> Response:
+    return Response(status_code=HTTP_304_NOT_MODIFIED, headers=dict(headers))
+
+
+def parse_range_header(header: str, size: int) -> Optional[List[Tuple[int, int]]]:
+    """
+    Parses a Range header into a sorted list of inclusive (start, end) byte
+    ranges, merging overlapping or adjacent ones.
+
+    :param header: the value of the Range header.
+    :param size: the size in bytes of the file.
+    :return: the satisfiable ranges, an empty list if none is satisfiable, or
+        None if the header is malformed or should be ignored.
+    """
+    unit, _, specs = header.partition("=")
+    if unit.strip().lower() != "bytes" or not specs:
+        return None
+    ranges: List[Tuple[int, int]] = []
+    for spec in specs.split(","):
+        match = RANGE_SPEC_REGEX.match(spec)
+        if match is None:
+            return None
+        start, end = match.groups()
+        if start == "" and end == "":
+            return None
+        if start == "":
+            length = int(end)
+            if length == 0 or size == 0:
+                continue
+            ranges.append((max(size - length, 0), size - 1))
+            continue
+        first = int(start)
+        last = size - 1 if end == "" else min(int(end), size - 1)
+        if end != "" and int(end) < first:
+            return None
+        if first < size:
+            ranges.append((first, last))
+    if len(ranges) > MAX_RANGES:
+        return None
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def accel_redirect_response(
+    path: str, root: str, prefix: str, headers: Mapping[str, str]
+) -> Response:
+    """
+    Returns an empty response that asks nginx to serve the file itself from an
+    internal location, so no file bytes go through the worker.
+
+    :param path: the path of the file to serve.
+    :param root: the directory the internal nginx location is aliased to.
+    :param prefix: the internal nginx location (e.g. /protected_uploads/).
+    :param headers: the validator and cache headers to add to the response.
+        nginx does not pass them through on its own; the internal location
+        must add back ETag, Vary and Cache-Control (see nginx.conf).
+    :return: a response carrying the X-Accel-Redirect header.
+    """
+    relative_path = os.path.relpath(path, root).replace(os.sep, "/")
+    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    return Response(
+        media_type=media_type,
+        headers={
+            **headers,
+            "X-Accel-Redirect": f"{prefix.rstrip('/')}/{quote(relative_path)}",
+        },
+    )
+
+
+async def _read_ranges_async(
+    path: str, ranges: List[Tuple[int, int]], parts: Optional[List[bytes]] = None
+) -> AsyncIterator[bytes]:
+    async with await anyio.open_file(path, mode="rb") as buffer:
+        for index, (start, end) in enumerate(ranges):
+            if parts is not None:
+                yield parts[index]
+            await buffer.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                block = await buffer.read(min(CHUNK_SIZE, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+                yield block
+        if parts is not None:
+            yield parts[-1]
+
+
+def file_response(
+    path: str, request: Request, headers: Mapping[str, str], etag: str
+) -> Response:
+    """
+    Returns a response for the file in path honoring single and multi-part
+    Range requests. If-Range is only honored when it carries the current ETag.
+
+    :param path: the path of the file to serve.
+    :param request: the incoming request.
+    :param headers: the validator and cache headers to add to the response.
+    :param etag: the strong ETag of the file.
+    :return: a 200, 206 or 416 response.
+    """
+    headers = {**headers, "Accept-Ranges": "bytes"}
+    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if not range_header or (if_range is not None and if_range.strip() != etag):
+        return FileResponse(path, media_type=media_type, headers=headers)
+    size = os.stat(path).st_size
+    ranges = parse_range_header(range_header, size)
+    if ranges is None:
+        return FileResponse(path, media_type=media_type, headers=headers)
+    if not ranges:
+        return Response(
+            status_code=HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={**headers, "Content-Range": f"bytes */{size}"},
+        )
+    if len(ranges) == 1:
+        start, end = ranges[0]
+        return StreamingResponse(
+            _read_ranges_async(path, ranges),
+            status_code=HTTP_206_PARTIAL_CONTENT,
+            media_type=media_type,
+            headers={
+                **headers,
+                "Content-Range": f"bytes {start}-{end}/{size}",
+                "Content-Length": f"{end - start + 1}",
+            },
+        )
+    boundary = uuid.uuid4().hex
+    parts = [
+        (
+            f"--{boundary}\r\n"
+            f"Content-Type: {media_type}\r\n"
+            f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+        ).encode()
+        for start, end in ranges
+    ]
+    parts = [parts[0], *[b"\r\n" + part for part in parts[1:]]]
+    parts.append(f"\r\n--{boundary}--\r\n".encode())
+    content_length = sum(len(part) for part in parts) + sum(
+        end - start + 1 for start, end in ranges
+    )
+    return StreamingResponse(
+        _read_ranges_async(path, ranges, parts),
+        status_code=HTTP_206_PARTIAL_CONTENT,
+        media_type=f"multipart/byteranges; boundary={boundary}",
+        headers={**headers, "Content-Length": f"{content_length}"},
+    )
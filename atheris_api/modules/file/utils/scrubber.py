@@ -0,0 +1,172 @@
+# Python imports
+import asyncio
+from datetime import datetime, timedelta
+import hashlib
+import os
+import socket
+import time
+import uuid
+from typing import Optional
+
+# PyMongo imports
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+# FastAPI imports
+from fastapi.concurrency import run_in_threadpool
+
+# Beanie imports
+from beanie.odm.operators.update.general import Set
+
+# Own imports
+from config.base_settings import get_settings
+from ..models.file import FileModel
+from ..models.scrub import ScrubCheckpointModel, ScrubResultModel, ScrubStatusEnum
+from .file import FileUploadDirectoryEnum, get_storage, get_verification_cache
+
+SCRUB_BLOCK_SIZE = 64 * 1024
+
+
+def hash_throttled(path: str, rate: int) -> str:
+    """
+    Returns the sha256 of a file, reading it at no more than rate bytes per
+    second (0 disables the limit).
+    """
+    sha256_hash = hashlib.sha256()
+    started = time.monotonic()
+    read = 0
+    with open(path, "rb") as buffer:
+        for block in iter(lambda: buffer.read(SCRUB_BLOCK_SIZE), b""):
+            sha256_hash.update(block)
+            read += len(block)
+            if rate > 0:
+                delay = read / rate - (time.monotonic() - started)
+                if delay > 0:
+                    time.sleep(delay)
+    return sha256_hash.hexdigest()
+
+
+class FileScrubber:
+    """
+    Walks the stored files in _id order, hashing each one at a bounded I/O
+    rate and recording whether it is intact, corrupt or missing.
+
+    Progress is checkpointed in Mongo after every batch, so a restart resumes
+    the current pass. A lease on the checkpoint keeps several workers from
+    scrubbing at the same time.
+    """
+
+    def __init__(
+        self,
+        dir: FileUploadDirectoryEnum = FileUploadDirectoryEnum.SLIDES,
+        batch: int = 100,
+    ) -> None:
+        settings = get_settings()
+        self.__dir = dir
+        self.__batch = batch
+        self.__rate = settings.FILE_SCRUB_RATE
+        self.__interval = settings.FILE_SCRUB_INTERVAL
+        self.__lease = settings.FILE_SCRUB_LEASE
+        self.__owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}"
+        self.name = dir.name.lower()
+
+    async def _acquire_lease_async(self) -> Optional[dict]:
+        now = datetime.utcnow()
+        collection = ScrubCheckpointModel.get_motor_collection()
+        try:
+            return await collection.find_one_and_update(
+                {
+                    "_id": self.name,
+                    "$or": [
+                        {"owner": self.__owner},
+                        {"lease_until": None},
+                        {"lease_until": {"$lt": now}},
+                    ],
+                },
+                {
+                    "$set": {
+                        "owner": self.__owner,
+                        "lease_until": now + timedelta(seconds=self.__lease),
+                    }
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            return None
+
+    async def _save_checkpoint_async(self, values: dict) -> None:
+        await ScrubCheckpointModel.get_motor_collection().update_one(
+            {"_id": self.name, "owner": self.__owner}, {"$set": values}
+        )
+
+    def _check_file(self, file: FileModel) -> tuple:
+        storage = get_storage(self.__dir)
+        path = storage.resolve_path(
+            storage.get_name(sha256=file.sha256, md5=file.md5, ext=file.ext)
+        )
+        if path is None:
+            return (ScrubStatusEnum.MISSING.value, None)
+        cache = get_verification_cache()
+        try:
+            signature = cache.get_signature(path)
+            sha256 = hash_throttled(path, self.__rate)
+        except FileNotFoundError:
+            return (ScrubStatusEnum.MISSING.value, None)
+        if sha256 != file.sha256:
+            cache.discard(path)
+            return (ScrubStatusEnum.CORRUPT.value, list(signature))
+        cache.add(path=path, sha256=sha256, signature=signature)
+        return (ScrubStatusEnum.OK.value, list(signature))
+
+    async def scrub_file_async(self, file: FileModel) -> str:
+        status, signature = await run_in_threadpool(self._check_file, file)
+        values = {
+            "status": status,
+            "signature": signature,
+            "checked_at": datetime.utcnow(),
+        }
+        await ScrubResultModel.find_one(ScrubResultModel.file == file.id).upsert(
+            Set(values), on_insert=ScrubResultModel(file=file.id, **values)
+        )
+        return status
+
+    async def scrub_batch_async(self) -> bool:
+        """
+        Scrubs the next batch of the current pass.
+
+        :return: False if another worker holds the lease or the pass finished.
+        """
+        checkpoint = await self._acquire_lease_async()
+        if checkpoint is None:
+            return False
+        last_file = checkpoint.get("last_file")
+        if last_file is None:
+            await self._save_checkpoint_async({"pass_started_at": datetime.utcnow()})
+        query = {} if last_file is None else {"_id": {"$gt": last_file}}
+        files = await FileModel.find(query).sort("+_id").limit(self.__batch).to_list()
+        for index, file in enumerate(files):
+            # Hashing at a throttled rate can outlast the lease, so it is
+            # renewed before every file instead of once per batch.
+            if index and await self._acquire_lease_async() is None:
+                return False
+            await self.scrub_file_async(file)
+        if not files:
+            await self._save_checkpoint_async(
+                {"last_file": None, "pass_finished_at": datetime.utcnow()}
+            )
+            return False
+        await self._save_checkpoint_async({"last_file": files[-1].id})
+        return True
+
+    async def run_async(self) -> None:
+        while True:
+            try:
+                scrubbed = await self.scrub_batch_async()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"File scrubber error: {e}")
+                scrubbed = False
+            if not scrubbed:
+                await asyncio.sleep(self.__interval)
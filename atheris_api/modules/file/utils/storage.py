@@ -0,0 +1,110 @@
+# Python imports
+import hashlib
+import os
+import uuid
+from typing import Iterator, List, Optional
+
+
+class FileStorage:
+    """
+    A content-addressed store that fans files out into nested directories.
+
+    With a depth of 2 and a width of 2 the file ``abcdef...png`` is stored at
+    ``ab/cd/abcdef...png`` under the root directory. Files written by the flat
+    layout are still found in the root until they are migrated.
+
+    :param dir: the path parts of the root directory, relative to the cwd.
+    :param depth: the number of nested directory levels (0 keeps it flat).
+    :param width: the number of hash characters used by each level.
+    """
+
+    def __init__(self, dir: List[str], depth: int = 2, width: int = 2) -> None:
+        self.root = os.path.join(os.getcwd(), *dir)
+        self.depth = max(depth, 0)
+        self.width = max(width, 1)
+
+    @staticmethod
+    def get_name(sha256: str, md5: str, ext: str) -> str:
+        return "{}{}".format(hashlib.md5(f"{sha256}{md5}".encode()).hexdigest(), ext)
+
+    def get_path(self, name: str) -> str:
+        shards = [
+            name[level * self.width : (level + 1) * self.width]
+            for level in range(self.depth)
+        ]
+        return os.path.join(self.root, *shards, name)
+
+    def get_legacy_path(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def resolve_path(self, name: str) -> Optional[str]:
+        """
+        Returns the path where the file is stored, looking in the sharded
+        layout first and in the flat layout afterwards, or None if it does not
+        exist.
+        """
+        for path in (self.get_path(name), self.get_legacy_path(name)):
+            if os.path.exists(path):
+                return path
+        return None
+
+    def get_staging_path(self) -> str:
+        """
+        Returns a unique staging path inside the root, so moving it into place
+        with commit is an atomic rename on the same filesystem.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        return os.path.join(self.root, f".{uuid.uuid4().hex}.part")
+
+    def commit(self, staging_path: str, name: str) -> str:
+        path = self.get_path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(staging_path, path)
+        return path
+
+    def iter_legacy_names(self) -> Iterator[str]:
+        """
+        Yields the names of the files stored with the flat layout.
+        """
+        if not os.path.isdir(self.root):
+            return
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith("."):
+                    yield entry.name
+
+    def iter_paths(self) -> Iterator[str]:
+        """
+        Yields the path of every stored file, in both layouts, skipping
+        staging files and hidden directories such as the quarantine.
+        """
+        for root, dirs, files in os.walk(self.root):
+            dirs[:] = [dir for dir in dirs if not dir.startswith(".")]
+            for name in files:
+                if not name.startswith("."):
+                    yield os.path.join(root, name)
+
+    def link_legacy_file(self, name: str) -> bool:
+        """
+        Hard links a flat-layout file into its sharded path, leaving the old
+        path in place so in-flight readers keep working.
+
+        :return: True if the file is now reachable through the sharded path.
+        """
+        path = self.get_path(name)
+        if self.depth == 0 or os.path.exists(path):
+            return self.depth != 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            os.link(self.get_legacy_path(name), path)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            return False
+        return True
+
+    def remove_legacy_file(self, name: str) -> None:
+        try:
+            os.remove(self.get_legacy_path(name))
+        except FileNotFoundError:
+            pass
@@ -1,11 +1,17 @@
 # Pydantic imports
 import re
+from typing import List
 from pydantic import Field
 
+# PyMongo imports
+from pymongo import IndexModel
+
 # Beanie imports
 from beanie import Document, Indexed, PydanticObjectId
 
 # Own imports
+from atheris_api.utils.paginate import invalidate_counts
+from atheris_api.utils.search import get_search_fields
 from ..schemas.home import ProductSlideSchema, SlideInfoSchema
 
 
@@ -15,10 +21,18 @@ class ProductSlideModel(Document):
     desc: str = Field(...)
     banner: str = Field(...)
     slideInfo: SlideInfoSchema = Field(...)
+    title_folded: str = Field(default="")
+    title_trigrams: List[str] = Field(default_factory=list)
 
     class Config:
         name = "productSlides"
 
+    class Settings:
+        indexes = [
+            IndexModel([("title_trigrams", 1)]),
+            IndexModel([("banner", 1)]),
+        ]
+
     @classmethod
     async def get_or_create_async(
         cls, product_slide: ProductSlideSchema
@@ -34,8 +48,10 @@ class ProductSlideModel(Document):
                     desc=product_slide.desc,
                     banner=product_slide.banner,
                     slideInfo=product_slide.slideInfo,
+                    **get_search_fields("title", product_slide.title),
                 )
             )
+            invalidate_counts(cls)
         if not isinstance(product_slideQ, cls):
             raise Exception(
                 "An unexpected error occurred when trying to get or create the "
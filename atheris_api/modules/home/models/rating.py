@@ -1,12 +1,18 @@
 # Pydantic imports
 import re
-from typing import Optional
+from typing import Dict, List, Optional
 from pydantic import Field
 
+# PyMongo imports
+from pymongo import IndexModel
+
 # Beanie imports
 from beanie import Document, Indexed, PydanticObjectId
 
 # Own imports
+from atheris_api.modules.product.utils.events import notify_track_changed
+from atheris_api.utils.paginate import invalidate_counts
+from atheris_api.utils.search import get_search_fields
 from ..schemas.rating import RatingSchema
 
 
@@ -15,10 +21,18 @@ class RatingModel(Document):
     comment: str = Field(...)
     qualification: float = Field(...)
     owner: Optional[PydanticObjectId] = Field(default=None)
+    comment_folded: str = Field(default="")
+    comment_trigrams: List[str] = Field(default_factory=list)
 
     class Config:
         name = "ratings"
 
+    class Settings:
+        indexes = [
+            IndexModel([("comment_trigrams", 1)]),
+            IndexModel([("owner", 1)]),
+        ]
+
     @classmethod
     async def create_async(cls, rating: RatingSchema) -> "RatingModel":
         ratingQ = await cls.insert_one(
@@ -26,16 +40,77 @@ class RatingModel(Document):
                 comment=rating.comment,
                 qualification=rating.qualification,
                 owner=rating.owner,
+                **get_search_fields("comment", rating.comment),
             )
         )
+        invalidate_counts(cls)
+        await RatingSummaryModel.add_async(qualification=ratingQ.qualification)
         if not isinstance(ratingQ, cls):
             raise Exception(
                 "An unexpected error occurred when trying to get or create the "
                 f"{cls.__name__} type object."
             )
+        notify_track_changed(ratingQ.owner)
         return ratingQ
 
+    @classmethod
+    async def exists_for_owner_async(cls, owner: PydanticObjectId) -> bool:
+        rating = await cls.get_motor_collection().find_one(
+            {"owner": owner}, projection={"_id": 1}
+        )
+        return rating is not None
+
+
+def get_star(qualification: float) -> str:
+    """
+    Returns the histogram bucket of a qualification, rounded half up to 1-5.
+    """
+    return f"{min(max(int(qualification + 0.5), 1), 5)}"
+
+
+class RatingSummaryModel(Document):
+    """
+    Aggregate of every rating, kept up to date with $inc as ratings are
+    created, so the average is read without scanning the ratings.
+    """
+
+    id: str = Field(default="ratings", alias="_id")
+    ratings_count: int = Field(default=0)
+    qualification_sum: float = Field(default=0.0)
+    histogram: Dict[str, int] = Field(default_factory=dict)
+
+    class Settings:
+        name = "ratingSummaries"
+
+    @classmethod
+    async def add_async(cls, qualification: float) -> None:
+        await cls.get_motor_collection().update_one(
+            {"_id": "ratings"},
+            {
+                "$inc": {
+                    "ratings_count": 1,
+                    "qualification_sum": qualification,
+                    f"histogram.{get_star(qualification)}": 1,
+                }
+            },
+            upsert=True,
+        )
+
+    @classmethod
+    async def get_or_empty_async(cls) -> "RatingSummaryModel":
+        summary = await cls.get_motor_collection().find_one({"_id": "ratings"})
+        if summary is None:
+            return cls()
+        return cls.parse_obj(summary)
+
+    @property
+    def average(self) -> float:
+        if not self.ratings_count:
+            return 0.0
+        return self.qualification_sum / self.ratings_count
+
 
 models = [
     RatingModel,
+    RatingSummaryModel,
 ]
@@ -2,6 +2,7 @@
 from fastapi import APIRouter
 
 # Own imports
+from ..schemas.home import ProductSlideListSchema
 from ..services.home import HomeRequest
 
 router = APIRouter()
@@ -10,6 +11,7 @@ router.add_api_route(
     "/product_slide",
     methods=["GET"],
     endpoint=HomeRequest().get_async,
+    response_model=ProductSlideListSchema,
 )
 
 router.add_api_route(
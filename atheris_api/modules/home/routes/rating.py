@@ -2,6 +2,7 @@
 from fastapi import APIRouter
 
 # Own imports
+from ..schemas.rating import RatingListSchema
 from ..services.rating import RatingRequest
 
 router = APIRouter()
@@ -10,6 +11,7 @@ router.add_api_route(
     "/rating",
     methods=["GET"],
     endpoint=RatingRequest().get_async,
+    response_model=RatingListSchema,
 )
 
 router.add_api_route(
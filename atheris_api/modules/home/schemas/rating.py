@@ -9,7 +9,7 @@ from beanie import PydanticObjectId
 
 # Own imports
 from atheris_api.utils.paginate import PaginatedListSchema
-from atheris_api.utils.regex import RegexEnum, RegexValidators
+from atheris_api.utils.regex import RegexEnum, get_validator
 
 
 class RatingSchema(BaseModel):
@@ -31,7 +31,7 @@ class RatingSchema(BaseModel):
 
     @validator("comment", pre=True, always=True)
     def check_title(cls, value: str) -> str:
-        validator = (RegexValidators(regex=RegexEnum.TEXT, value=value)).validate
+        validator = get_validator(RegexEnum.TEXT).validate(value)
         if not validator.get("match"):
             raise ValueError(
                 validator.get("message"),
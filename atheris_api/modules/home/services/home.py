@@ -1,5 +1,5 @@
 # Python imports
-from typing import Dict, List
+from typing import Dict, List, Optional
 import json
 
 # Starlette imports
@@ -13,40 +13,38 @@ from fastapi.responses import JSONResponse
 
 # Own imports
 from atheris_api.modules.file.services.file import FileRequest
+from atheris_api.modules.file.utils.file import Files, get_slide_url
 from atheris_api.modules.home.models.home import ProductSlideModel
-from atheris_api.modules.home.schemas.home import (
-    ProductSlideSchema,
-    ProductSlideListSchema,
-)
+from atheris_api.modules.home.schemas.home import ProductSlideSchema
 from atheris_api.utils.paginate import PaginatedListSchema, PaginatedRequest
 
 
 class HomeRequest(PaginatedRequest):
     async def get_async(
-        self, limit: int = 10, page: int = 1, title: str = ""
-    ) -> ProductSlideListSchema:
-        results: List[ProductSlideSchema] = []
-        product_slides: List[ProductSlideModel]
+        self,
+        limit: int = 10,
+        page: int = 1,
+        title: str = "",
+        count: bool = True,
+        cursor: Optional[str] = None,
+    ) -> JSONResponse:
+        product_slides: List[Dict]
         page_information: PaginatedListSchema
         page_information, product_slides = await self.get_query_by_field_async(
-            ProductSlideModel, "title", title, limit, page
+            ProductSlideModel,
+            "title",
+            title,
+            limit,
+            page,
+            with_total=count,
+            cursor=cursor,
+            projection=["title", "desc", "banner", "slideInfo"],
         )
-        for product_slide in product_slides:
-            results.append(
-                ProductSlideSchema(
-                    id=product_slide.id,
-                    title=product_slide.title,
-                    desc=product_slide.desc,
-                    banner=product_slide.banner,
-                    slideInfo=product_slide.slideInfo,
-                )
-            )
-        return ProductSlideListSchema(
-            total=page_information.total,
-            num_pages=page_information.num_pages,
-            current_page=page_information.current_page,
-            per_page=page_information.per_page,
-            results=results,
+        # The projected documents already have the shape of ProductSlideSchema
+        # (declared as the route's response_model), so they are sent as they
+        # are instead of being validated once per model.
+        return JSONResponse(
+            content={**page_information.dict(), "results": product_slides}
         )
 
     async def create_product_slide_async(
@@ -80,7 +78,13 @@ specifications (List[title (str): Title of the specification, desc (str): Descri
         ]
     })""",
         ),
-        file: UploadFile = File(..., description="Banner image for the product slide"),
+        file: Optional[UploadFile] = File(
+            None, description="Banner image for the product slide"
+        ),
+        md5: Optional[str] = Form(
+            None,
+            description="md5 of a banner already uploaded (e.g. with /upload_slides), used when no file is sent",
+        ),
     ) -> JSONResponse:
         try:
             slideInfoDict: Dict = json.loads(slideInfo)
@@ -111,8 +115,22 @@ specifications (List[title (str): Title of the specification, desc (str): Descri
                     ],
                 )
         else:
-            hash = await FileRequest().upload_slide_async(file=file)
-            product_slide.banner = f"/read_slide?hash={hash.get('upload_dir')}"
+            if file is not None:
+                hash = await FileRequest().upload_slide_async(file=file)
+                product_slide.banner = get_slide_url(hash.get("upload_dir"))
+            elif md5:
+                banner = await Files.get_existing_file_async(hash=md5)
+                product_slide.banner = get_slide_url(banner.md5)
+            else:
+                raise HTTPException(
+                    status_code=HTTP_400_BAD_REQUEST,
+                    detail=[
+                        {
+                            "field": "file",
+                            "msg": "Debe enviar el banner o el md5 de un banner ya cargado.",
+                        }
+                    ],
+                )
             await ProductSlideModel.get_or_create_async(product_slide=product_slide)
             return JSONResponse(
                 status_code=HTTP_201_CREATED,
@@ -1,6 +1,5 @@
 # Starlette imports
-from functools import reduce
-from typing import List
+from typing import Dict, List, Optional
 from starlette.status import HTTP_201_CREATED
 
 # FastAPI imports
@@ -8,47 +7,38 @@ from fastapi import Body
 from fastapi.responses import JSONResponse
 
 # Own imports
-from atheris_api.modules.home.models.rating import RatingModel
-from atheris_api.modules.home.schemas.rating import (
-    RatingAverageSchema,
-    RatingListSchema,
-    RatingSetSchema,
-)
+from atheris_api.modules.home.models.rating import RatingModel, RatingSummaryModel
+from atheris_api.modules.home.schemas.rating import RatingSetSchema
 from atheris_api.utils.paginate import PaginatedListSchema, PaginatedRequest
 
 
 class RatingRequest(PaginatedRequest):
     async def get_async(
-        self, limit: int = 1, page: int = 1, comment: str = ""
-    ) -> RatingListSchema:
-        results: List[RatingAverageSchema] = []
-        ratings: List[RatingModel]
+        self,
+        limit: int = 1,
+        page: int = 1,
+        comment: str = "",
+        count: bool = True,
+        cursor: Optional[str] = None,
+    ) -> JSONResponse:
+        ratings: List[Dict]
         page_information: PaginatedListSchema
         page_information, ratings = await self.get_query_by_field_async(
-            RatingModel, "comment", comment, limit, page
+            RatingModel,
+            "comment",
+            comment,
+            limit,
+            page,
+            with_total=count,
+            cursor=cursor,
+            projection=["comment", "qualification"],
         )
-        all_ratings = await RatingModel.find_all().limit(1000).to_list()
-        total_qualification = reduce(
-            lambda acc, rating: acc + rating.qualification, all_ratings, 0
-        )
-        ratings_count = 1 if len(all_ratings) == 0 else len(all_ratings)
-        average = total_qualification / ratings_count
+        # The projected documents plus the average have the shape of
+        # RatingAverageSchema (declared as the route's response_model).
+        average = (await RatingSummaryModel.get_or_empty_async()).average
         for rating in ratings:
-            results.append(
-                RatingAverageSchema(
-                    id=rating.id,
-                    comment=rating.comment,
-                    qualification=rating.qualification,
-                    average=average,
-                )
-            )
-        return RatingListSchema(
-            total=page_information.total,
-            num_pages=page_information.num_pages,
-            current_page=page_information.current_page,
-            per_page=page_information.per_page,
-            results=results,
-        )
+            rating["average"] = average
+        return JSONResponse(content={**page_information.dict(), "results": ratings})
 
     async def create_rating_async(
         self,
@@ -0,0 +1,47 @@
+# Python imports
+import asyncio
+
+# Own imports
+from ..models.rating import RatingModel, RatingSummaryModel, get_star
+
+
+async def rebuild_rating_summary_async() -> dict:
+    """
+    Recomputes the rating summary from the ratings collection, for ratings
+    written before the summary existed or if it drifted (e.g. a process died
+    between inserting a rating and updating the summary).
+
+    :return: the rebuilt summary.
+    """
+    summary = RatingSummaryModel()
+    cursor = RatingModel.get_motor_collection().aggregate(
+        [{"$group": {"_id": "$qualification", "count": {"$sum": 1}}}]
+    )
+    async for group in cursor:
+        qualification = group["_id"] or 0.0
+        star = get_star(qualification)
+        summary.ratings_count += group["count"]
+        summary.qualification_sum += qualification * group["count"]
+        summary.histogram[star] = summary.histogram.get(star, 0) + group["count"]
+    await RatingSummaryModel.get_motor_collection().replace_one(
+        {"_id": summary.id}, summary.dict(exclude={"id"}), upsert=True
+    )
+    return summary.dict()
+
+
+async def _run_async() -> dict:
+    # Local imports: initializing Beanie needs every module's models.
+    from beanie import init_beanie
+    from config.beanie import db_session as mongo_db_session
+    from atheris_api.modules import models
+
+    mongo_db_session.init()
+    await init_beanie(mongo_db_session.get_database, document_models=[*models])
+    return await rebuild_rating_summary_async()
+
+
+def start():
+    try:
+        print(asyncio.run(_run_async()))
+    except Exception as e:
+        print(e)
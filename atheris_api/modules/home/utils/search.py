@@ -0,0 +1,67 @@
+# Python imports
+import asyncio
+from typing import List, Tuple
+
+# PyMongo imports
+from pymongo import UpdateOne
+
+# Beanie imports
+from beanie import Document
+
+# Own imports
+from atheris_api.utils.search import get_search_fields
+from ..models.home import ProductSlideModel
+from ..models.rating import RatingModel
+
+SEARCHABLE_FIELDS: List[Tuple[Document, str]] = [
+    (ProductSlideModel, "title"),
+    (RatingModel, "comment"),
+]
+
+
+async def rebuild_search_fields_async(batch: int = 500) -> dict:
+    """
+    Recomputes the search fields of every searchable document, for documents
+    written before the fields existed or after the folding rules change.
+
+    :param batch: the number of updates sent per bulk_write.
+    :return: the number of documents updated per collection.
+    """
+    updated = {}
+    for cls, field in SEARCHABLE_FIELDS:
+        collection = cls.get_motor_collection()
+        operations = []
+        updated[collection.name] = 0
+        async for document in collection.find({}, {field: 1}):
+            operations.append(
+                UpdateOne(
+                    {"_id": document["_id"]},
+                    {"$set": get_search_fields(field, document.get(field, ""))},
+                )
+            )
+            if len(operations) >= batch:
+                await collection.bulk_write(operations, ordered=False)
+                updated[collection.name] += len(operations)
+                operations = []
+        if operations:
+            await collection.bulk_write(operations, ordered=False)
+            updated[collection.name] += len(operations)
+    return updated
+
+
+async def _run_async() -> dict:
+    # Local imports: initializing Beanie needs every module's models.
+    from beanie import init_beanie
+    from config.beanie import db_session as mongo_db_session
+    from atheris_api.modules import models
+
+    mongo_db_session.init()
+    await init_beanie(mongo_db_session.get_database, document_models=[*models])
+    return await rebuild_search_fields_async()
+
+
+def start():
+    try:
+        print(asyncio.run(_run_async()))
+    except Exception as e:
+        print(e)
@@ -1,9 +1,17 @@
 # Pydantic imports
 from datetime import datetime
+from typing import List, Optional, Tuple
 
 # Pydantic imports
 from pydantic import EmailStr, Field
 
+# PyMongo imports
+from pymongo import IndexModel
+from pymongo.results import InsertManyResult
+
+# Motor imports
+from motor.motor_asyncio import AsyncIOMotorClientSession
+
 # Beanie imports
 from beanie import Document, Link, PydanticObjectId
 
@@ -26,18 +34,20 @@ class CustomerModel(Document):
         name = "customers"
 
     @classmethod
-    async def create_async(cls, customer: CustomerSchema) -> "CustomerModel":
-        customerQ = await cls.insert_one(
-            cls(
-                created_at=customer.createdAt,
-                document_number=customer.documentNumber,
-                names=customer.names,
-                cell_phone_number=customer.cellPhoneNumber,
-                email=customer.email,
-                city=customer.city,
-                address=customer.address,
-            )
+    def from_schema(cls, customer: CustomerSchema) -> "CustomerModel":
+        return cls(
+            created_at=customer.createdAt,
+            document_number=customer.documentNumber,
+            names=customer.names,
+            cell_phone_number=customer.cellPhoneNumber,
+            email=customer.email,
+            city=customer.city,
+            address=customer.address,
         )
+
+    @classmethod
+    async def create_async(cls, customer: CustomerSchema) -> "CustomerModel":
+        customerQ = await cls.insert_one(cls.from_schema(customer))
         if not isinstance(customerQ, cls):
             raise Exception(
                 "An unexpected error occurred when trying to get or create the "
@@ -67,35 +77,76 @@ class ProductModel(Document):
     class Config:
         name = "products"
 
+    class Settings:
+        indexes = [
+            IndexModel([("customer.$id", 1), ("status", 1)]),
+        ]
+
     @classmethod
-    async def create_async(
-        cls, product: ProductSchema, customer: CustomerModel
-    ) -> "CustomerModel":
-        customerQ = await cls.insert_one(
-            cls(
-                created_at=product.createdAt,
-                primary_color=product.primaryColor,
-                second_color=product.secondColor,
-                chest_width=product.chestWidth,
-                waist_width=product.waistWidth,
-                neck_to_hip_height=product.neckToHipHeight,
-                sleeve_length_shirt=product.sleeveLengthShirt,
-                sleeve_length_hoodie=product.sleeveLengthHoodie,
-                age=product.age,
-                height=product.height,
-                weight=product.weight,
-                shoe_size=product.shoeSize,
-                body_type=product.bodyType,
-                status=product.status,
-                customer=customer,
+    async def get_progress_async(cls, customer_id: PydanticObjectId) -> Tuple[int, int]:
+        """
+        Returns the number of products of a customer and how many are ready,
+        counted by the database from the (customer.$id, status) index.
+        """
+        progress = await (
+            cls.get_motor_collection()
+            .aggregate(
+                [
+                    {"$match": {"customer.$id": customer_id}},
+                    {
+                        "$group": {
+                            "_id": None,
+                            "total": {"$sum": 1},
+                            "ready": {"$sum": {"$cond": ["$status", 1, 0]}},
+                        }
+                    },
+                ]
             )
+            .to_list(length=1)
         )
-        if not isinstance(customerQ, cls):
+        if not progress:
+            return (0, 0)
+        return (progress[0]["total"], progress[0]["ready"])
+
+    @classmethod
+    def from_schema(
+        cls, product: ProductSchema, customer: CustomerModel
+    ) -> "ProductModel":
+        return cls(
+            created_at=product.createdAt,
+            primary_color=product.primaryColor,
+            second_color=product.secondColor,
+            chest_width=product.chestWidth,
+            waist_width=product.waistWidth,
+            neck_to_hip_height=product.neckToHipHeight,
+            sleeve_length_shirt=product.sleeveLengthShirt,
+            sleeve_length_hoodie=product.sleeveLengthHoodie,
+            age=product.age,
+            height=product.height,
+            weight=product.weight,
+            shoe_size=product.shoeSize,
+            body_type=product.bodyType,
+            status=product.status,
+            customer=customer,
+        )
+
+    @classmethod
+    async def create_many_async(
+        cls,
+        products: List["ProductModel"],
+        session: Optional[AsyncIOMotorClientSession] = None,
+    ) -> None:
+        """
+        Inserts already validated products with a single insert_many.
+        """
+        if not products:
+            return
+        productsQ = await cls.insert_many(products, session=session)
+        if not isinstance(productsQ, InsertManyResult):
             raise Exception(
-                "An unexpected error occurred when trying to get or create the "
-                f"{cls.__name__} type object."
+                "An unexpected error occurred when trying to create the "
+                f"{cls.__name__} type objects."
             )
-        return customerQ
 
 
 models = [
@@ -12,8 +12,32 @@ router.add_api_route(
     endpoint=ProductRequest().get_track_async,
 )
 
+router.add_api_route(
+    "/track/events",
+    methods=["GET"],
+    endpoint=ProductRequest().get_track_events_async,
+)
+
 router.add_api_route(
     "/customer",
     methods=["POST"],
     endpoint=ProductRequest().create_async,
 )
+
+router.add_api_route(
+    "/customer/import",
+    methods=["POST"],
+    endpoint=ProductRequest().import_async,
+)
+
+router.add_api_route(
+    "/product/status",
+    methods=["PUT"],
+    endpoint=ProductRequest().update_products_status_async,
+)
+
+router.add_api_route(
+    "/customer/status",
+    methods=["PUT"],
+    endpoint=ProductRequest().update_customers_status_async,
+)
@@ -1,6 +1,6 @@
 # Python imports
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 # Pydantic imports
 from pydantic import BaseModel, EmailStr, Field, validator
@@ -9,7 +9,7 @@ from pydantic import BaseModel, EmailStr, Field, validator
 from beanie import PydanticObjectId
 
 # Own imports
-from atheris_api.utils.regex import RegexEnum, RegexValidators
+from atheris_api.utils.regex import RegexEnum, get_validator
 
 
 class CustomerSchema(BaseModel):
@@ -56,9 +56,7 @@ class CustomerSchema(BaseModel):
 
     @validator("documentNumber")
     def check_document_number(cls, document_number: str) -> str:
-        validator = (
-            RegexValidators(regex=RegexEnum.DOCUMENT_NUMBER, value=document_number)
-        ).validate
+        validator = get_validator(RegexEnum.DOCUMENT_NUMBER).validate(document_number)
         if not validator.get("match"):
             raise ValueError(
                 validator.get("message"),
@@ -67,7 +65,7 @@ class CustomerSchema(BaseModel):
 
     @validator("names")
     def check_names(cls, names: str) -> str:
-        validator = (RegexValidators(regex=RegexEnum.WORD, value=names)).validate
+        validator = get_validator(RegexEnum.WORD).validate(names)
         if not validator.get("match"):
             raise ValueError(
                 validator.get("message"),
@@ -76,9 +74,9 @@ class CustomerSchema(BaseModel):
 
     @validator("cellPhoneNumber")
     def check_cell_phone_number(cls, cell_phone_number: str) -> str:
-        validator = (
-            RegexValidators(regex=RegexEnum.CELL_PHONE_NUMBER, value=cell_phone_number)
-        ).validate
+        validator = get_validator(RegexEnum.CELL_PHONE_NUMBER).validate(
+            cell_phone_number
+        )
         if not validator.get("match"):
             raise ValueError(
                 validator.get("message"),
@@ -87,7 +85,7 @@ class CustomerSchema(BaseModel):
 
     @validator("email", pre=True, always=True)
     def check_email(cls, email: str) -> str:
-        validator = (RegexValidators(regex=RegexEnum.EMAIL, value=email)).validate
+        validator = get_validator(RegexEnum.EMAIL).validate(email)
         if not validator.get("match"):
             raise ValueError(
                 validator.get("message"),
@@ -96,7 +94,7 @@ class CustomerSchema(BaseModel):
 
     @validator("city")
     def check_city(cls, city: str) -> str:
-        validator = (RegexValidators(regex=RegexEnum.WORD, value=city)).validate
+        validator = get_validator(RegexEnum.WORD).validate(city)
         if not validator.get("match"):
             raise ValueError(
                 validator.get("message"),
@@ -105,7 +103,7 @@ class CustomerSchema(BaseModel):
 
     @validator("address")
     def check_address(cls, address: str) -> str:
-        validator = (RegexValidators(regex=RegexEnum.ADDRESS, value=address)).validate
+        validator = get_validator(RegexEnum.ADDRESS).validate(address)
         if not validator.get("match"):
             raise ValueError(
                 validator.get("message"),
@@ -161,3 +159,31 @@ class ProductSchema(BaseModel):
     shoeSize: int = Field(..., description="Product's shoe size")
     bodyType: int = Field(..., description="Product's body type")
     status: bool = Field(default=False, description="Product's completion status")
+
+
+class StatusUpdateSchema(BaseModel):
+    """
+    Represents a bulk status update of products or customers.
+
+    Attributes:
+        ids (List[PydanticObjectId]): Identifiers of the documents to update.
+        status (bool): The status to set.
+    """
+
+    ids: List[PydanticObjectId] = Field(
+        ..., min_items=1, max_items=1000, description="Identifiers to update"
+    )
+    status: bool = Field(..., description="The status to set")
+
+
+class StatusUpdateResultSchema(BaseModel):
+    """
+    Represents the result of a bulk status update.
+
+    Attributes:
+        changed (List[str]): Identifiers whose status changed.
+        missing (List[str]): Identifiers that do not exist.
+    """
+
+    changed: List[str] = Field(..., description="Identifiers whose status changed")
+    missing: List[str] = Field(..., description="Identifiers that do not exist")
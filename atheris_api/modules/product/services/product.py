@@ -1,59 +1,206 @@
 # Starlette imports
-from typing import List
-from beanie import PydanticObjectId
+import asyncio
+from contextlib import nullcontext
+import json
+from typing import AsyncIterator, List, Optional, Set, Tuple
+from beanie import Document, PydanticObjectId
+from pymongo import UpdateOne
 from starlette.status import HTTP_200_OK
 
 # FastAPI imports
-from fastapi.responses import JSONResponse
+from fastapi import Body, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from atheris_api.modules.home.models.rating import RatingModel
 
 # Own imports
+from config.base_settings import get_settings
+from config.beanie import db_session as mongo_db_session
 from ..models.product import CustomerModel, ProductModel
-from ..schemas.product import CustomerSchema, ProductSchema
+from ..schemas.product import (
+    CustomerSchema,
+    ProductSchema,
+    StatusUpdateResultSchema,
+    StatusUpdateSchema,
+)
+from ..utils.events import get_track_broker, notify_track_changed
+from ..utils.importer import OrderImport
+from ..utils.track import get_track_cache
+
+TRACK_EVENTS_KEEP_ALIVE = 15
 
 
 class ProductRequest:
     async def create_async(
         self, customer: CustomerSchema, productList: List[ProductSchema]
     ) -> JSONResponse:
-        _customer = await CustomerModel.create_async(customer=customer)
-        for product in productList:
-            await ProductModel.create_async(product=product, customer=_customer)
+        # Every document is built (and validated) before the first write.
+        _customer = CustomerModel.from_schema(customer=customer)
+        products = [
+            ProductModel.from_schema(product=product, customer=_customer)
+            for product in productList
+        ]
+        transaction = (
+            mongo_db_session.start_transaction()
+            if get_settings().DATABASE_TRANSACTIONS
+            else nullcontext()
+        )
+        async with transaction as session:
+            await CustomerModel.insert_one(_customer, session=session)
+            await ProductModel.create_many_async(products=products, session=session)
+        notify_track_changed(_customer.id)
         return JSONResponse(
             status_code=HTTP_200_OK,
             content={"hash": f"{_customer.id}"},
         )
 
+    async def import_async(self, request: Request) -> StreamingResponse:
+        """
+        Imports orders from an NDJSON body, one POST /customer body per line.
+        The body is read as it arrives and the answer is NDJSON too: the
+        errors of each failed line and a final summary.
+        """
+        settings = get_settings()
+        order_import = OrderImport(batch=settings.IMPORT_BATCH_SIZE)
+        results = order_import.run_async(
+            request.stream(), max_line_size=settings.IMPORT_MAX_LINE_SIZE
+        )
+        return StreamingResponse(
+            (f"{json.dumps(result, ensure_ascii=False)}\n" async for result in results),
+            media_type="application/x-ndjson",
+        )
+
+    async def update_products_status_async(
+        self, update: StatusUpdateSchema = Body(...)
+    ) -> StatusUpdateResultSchema:
+        return await self._update_status_async(ProductModel, update)
+
+    async def update_customers_status_async(
+        self, update: StatusUpdateSchema = Body(...)
+    ) -> StatusUpdateResultSchema:
+        return await self._update_status_async(CustomerModel, update)
+
+    async def _update_status_async(
+        self, cls: Document, update: StatusUpdateSchema
+    ) -> StatusUpdateResultSchema:
+        """
+        Sets the status of many documents with one bulk_write. Each update
+        only matches a document whose status differs, so repeating a request
+        changes nothing. The customers of the changed documents are notified.
+        """
+        ids = list(dict.fromkeys(update.ids))
+        collection = cls.get_motor_collection()
+        found: Set[PydanticObjectId] = set()
+        changed: List[PydanticObjectId] = []
+        tracks: Set[PydanticObjectId] = set()
+        async for document in collection.find(
+            {"_id": {"$in": ids}}, {"status": 1, "customer": 1}
+        ):
+            found.add(document["_id"])
+            if document.get("status") != update.status:
+                changed.append(document["_id"])
+                customer = document.get("customer")
+                tracks.add(document["_id"] if customer is None else customer.id)
+        if changed:
+            await collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": id, "status": {"$ne": update.status}},
+                        {"$set": {"status": update.status}},
+                    )
+                    for id in changed
+                ],
+                ordered=False,
+            )
+        for track in tracks:
+            notify_track_changed(track)
+        return StatusUpdateResultSchema(
+            changed=[f"{id}" for id in changed],
+            missing=[f"{id}" for id in ids if id not in found],
+        )
+
     async def get_track_async(self, track: PydanticObjectId) -> JSONResponse:
-        _customer = await CustomerModel.get(document_id=track)
-        total = 0
-        ready = 0
+        track_information, age = await self._get_cached_track_information_async(track)
+        return JSONResponse(
+            status_code=HTTP_200_OK,
+            content=track_information,
+            headers={
+                "X-Cache": "MISS" if age is None else "HIT",
+                "Age": f"{int(age or 0)}",
+            },
+        )
+
+    async def get_track_events_async(
+        self, track: PydanticObjectId
+    ) -> StreamingResponse:
+        """
+        Streams the /track answer as server-sent events: once on connection
+        and again whenever a write changes it, with a comment every few
+        seconds to keep proxies from closing an idle stream.
+        """
+        return StreamingResponse(
+            self._stream_track_events_async(track),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def _stream_track_events_async(
+        self, track: PydanticObjectId
+    ) -> AsyncIterator[str]:
+        last = None
+        with get_track_broker().subscribe(track) as queue:
+            while True:
+                track_information, _ = await self._get_cached_track_information_async(
+                    track
+                )
+                if track_information != last:
+                    last = track_information
+                    yield f"event: track\ndata: {json.dumps(track_information)}\n\n"
+                # Only a notification recomputes the answer; an idle stream
+                # just sends keep-alives.
+                while True:
+                    try:
+                        await asyncio.wait_for(queue.get(), TRACK_EVENTS_KEEP_ALIVE)
+                        break
+                    except asyncio.TimeoutError:
+                        yield ": keep-alive\n\n"
+
+    async def _get_cached_track_information_async(
+        self, track: PydanticObjectId
+    ) -> Tuple[dict, Optional[float]]:
+        """
+        Returns the /track answer and its age in seconds, or None as the age
+        when it was just computed.
+        """
+        cache = get_track_cache()
+        cached = cache.get(track)
+        if cached is not None:
+            return cached
+        track_information = await self._get_track_information_async(track)
+        cache.set(track, track_information)
+        return (track_information, None)
+
+    async def _get_track_information_async(self, track: PydanticObjectId) -> dict:
+        _customer, (total, ready), rating = await asyncio.gather(
+            CustomerModel.get_motor_collection().find_one(
+                {"_id": track}, {"status": 1}
+            ),
+            ProductModel.get_progress_async(customer_id=track),
+            RatingModel.exists_for_owner_async(owner=track),
+        )
         status = 0
-        rating = False
-        if _customer:
-            productList = await ProductModel.find(
-                {"customer.$id": _customer.id}
-            ).to_list()
-            if await RatingModel.find({"owner": _customer.id}).first_or_none():
-                rating = True
-            for product in productList:
-                total += 1
-                if product.status:
-                    ready += 1
-        if total > 0:
-            if _customer.status:
+        if _customer is None:
+            total, ready, rating = 0, 0, False
+        elif total > 0:
+            if _customer.get("status"):
                 status = 3
             elif ready == total:
                 status = 2
             else:
                 status = 1
-        return JSONResponse(
-            status_code=HTTP_200_OK,
-            content={
-                "total": total,
-                "ready": ready,
-                "status": status,
-                "rating": rating,
-            },
-        )
+        return {
+            "total": total,
+            "ready": ready,
+            "status": status,
+            "rating": rating,
+        }
@@ -0,0 +1,113 @@
+# Python imports
+import asyncio
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Set
+
+# Beanie imports
+from beanie import PydanticObjectId
+
+# Own imports
+from .track import get_track_cache
+
+
+class TrackBroker:
+    """
+    In-process pub/sub of the customers whose /track answer changed.
+
+    Each subscriber gets a queue of size one: notifications that arrive while
+    one is pending are coalesced, since the subscriber recomputes the whole
+    answer anyway.
+    """
+
+    def __init__(self) -> None:
+        self.__subscribers: Dict[PydanticObjectId, Set[asyncio.Queue]] = {}
+
+    @contextmanager
+    def subscribe(self, track: PydanticObjectId) -> Iterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self.__subscribers.setdefault(track, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self.__subscribers.get(track, set())
+            subscribers.discard(queue)
+            if not subscribers:
+                self.__subscribers.pop(track, None)
+
+    def publish(self, track: PydanticObjectId) -> None:
+        for queue in self.__subscribers.get(track, ()):
+            if queue.empty():
+                queue.put_nowait(track)
+
+    def __len__(self) -> int:
+        return sum(len(subscribers) for subscribers in self.__subscribers.values())
+
+
+@lru_cache
+def get_track_broker() -> TrackBroker:
+    return TrackBroker()
+
+
+def notify_track_changed(track: Optional[PydanticObjectId]) -> None:
+    """
+    Invalidates the cached /track answer of a customer and wakes up its
+    event streams. Every write that changes the answer calls it.
+    """
+    if track is None:
+        return
+    get_track_cache().invalidate(track)
+    get_track_broker().publish(track)
+
+
+class TrackChangeStream:
+    """
+    Feeds notify_track_changed from MongoDB change streams on the customers,
+    products and ratings collections, so writes made by other processes (or
+    directly in Mongo) also reach the event streams. Change streams require
+    a replica set; a single-node one is enough.
+    """
+
+    OPERATIONS = ["insert", "update", "replace", "delete"]
+
+    async def _watch_async(self, collection, get_track) -> None:
+        pipeline = [{"$match": {"operationType": {"$in": self.OPERATIONS}}}]
+        async with collection.watch(pipeline, full_document="updateLookup") as stream:
+            async for change in stream:
+                notify_track_changed(get_track(change))
+
+    @staticmethod
+    def _get_customer(change: dict) -> Optional[PydanticObjectId]:
+        return change.get("documentKey", {}).get("_id")
+
+    @staticmethod
+    def _get_product_customer(change: dict) -> Optional[PydanticObjectId]:
+        customer = (change.get("fullDocument") or {}).get("customer")
+        return getattr(customer, "id", None)
+
+    @staticmethod
+    def _get_rating_owner(change: dict) -> Optional[PydanticObjectId]:
+        return (change.get("fullDocument") or {}).get("owner")
+
+    async def run_async(self) -> None:
+        # Local imports: the models import this module's notify_track_changed.
+        from atheris_api.modules.home.models.rating import RatingModel
+        from ..models.product import CustomerModel, ProductModel
+
+        watches = [
+            (CustomerModel, self._get_customer),
+            (ProductModel, self._get_product_customer),
+            (RatingModel, self._get_rating_owner),
+        ]
+        while True:
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    for cls, get_track in watches:
+                        task_group.create_task(
+                            self._watch_async(cls.get_motor_collection(), get_track)
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Track change stream error: {e}")
+                await asyncio.sleep(5)
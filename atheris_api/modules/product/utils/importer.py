@@ -0,0 +1,227 @@
+# Python imports
+import argparse
+import asyncio
+import json
+import sys
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+# Pydantic imports
+from pydantic import ValidationError
+
+# PyMongo imports
+from pymongo.errors import BulkWriteError
+
+# Own imports
+from config.base_settings import get_settings
+from ..models.product import CustomerModel, ProductModel
+from ..schemas.product import CustomerSchema, ProductSchema
+from .events import notify_track_changed
+
+
+def get_errors(error: Exception) -> List[dict]:
+    """
+    Returns an error as the list of {field, msg} the API answers with.
+    """
+    if isinstance(error, ValidationError):
+        return [
+            {"field": error["loc"][-1] if error["loc"] else "", "msg": error["msg"]}
+            for error in error.errors()
+        ]
+    return [{"field": "generalScope", "msg": f"{error}"}]
+
+
+async def iter_lines_async(
+    chunks: AsyncIterator[bytes], max_line_size: int
+) -> AsyncIterator[Tuple[int, Optional[bytes]]]:
+    """
+    Splits a byte stream into numbered lines without reading it whole.
+    Lines longer than max_line_size are yielded as None and skipped.
+    """
+    number = 0
+    buffer = b""
+    skipping = False
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            number += 1
+            yield (number, None if skipping or len(line) > max_line_size else line)
+            skipping = False
+        if len(buffer) > max_line_size:
+            buffer = b""
+            skipping = True
+    if buffer or skipping:
+        yield (number + 1, None if skipping else buffer)
+
+
+class OrderImport:
+    """
+    Imports orders from NDJSON, one {"customer": ..., "productList": [...]}
+    object per line, the same body POST /customer takes.
+
+    Lines are validated as they are read and the valid ones are written in
+    bounded batches with insert_many. The next chunk is not read until the
+    batch is written, so memory stays flat whatever the size of the input.
+    Only the lines that fail are reported, followed by a summary.
+
+    :param batch: the maximum number of orders written per insert_many.
+    """
+
+    def __init__(self, batch: int) -> None:
+        self.batch = max(batch, 1)
+        self.lines = 0
+        self.imported = 0
+        self.failed = 0
+
+    def _parse(self, line: bytes) -> Tuple[CustomerModel, List[ProductModel]]:
+        order = json.loads(line)
+        if not isinstance(order, dict):
+            raise ValueError("Cada línea debe ser un objeto JSON.")
+        customer = CustomerModel.from_schema(
+            customer=CustomerSchema.parse_obj(order.get("customer"))
+        )
+        products = [
+            ProductModel.from_schema(
+                product=ProductSchema.parse_obj(product), customer=customer
+            )
+            for product in order.get("productList") or []
+        ]
+        return (customer, products)
+
+    @staticmethod
+    async def _insert_many_async(model, documents: list) -> Dict[int, str]:
+        """
+        Inserts documents with an unordered insert_many.
+
+        :return: the error message of each document that failed, by index.
+        """
+        if not documents:
+            return {}
+        try:
+            await model.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            return {
+                error["index"]: error["errmsg"] for error in e.details["writeErrors"]
+            }
+        return {}
+
+    async def _write_async(
+        self, orders: List[Tuple[int, CustomerModel, List[ProductModel]]]
+    ) -> List[dict]:
+        failed_customers = await self._insert_many_async(
+            CustomerModel, [customer for _, customer, _ in orders]
+        )
+        products = []
+        product_orders = []
+        for index, (_, _, order_products) in enumerate(orders):
+            if index not in failed_customers:
+                products += order_products
+                product_orders += [index] * len(order_products)
+        failed_orders = {}
+        failed_products = await self._insert_many_async(ProductModel, products)
+        for index, message in failed_products.items():
+            failed_orders.setdefault(product_orders[index], message)
+        if failed_orders:
+            await self._delete_orders_async(
+                customers=[orders[index][1] for index in failed_orders],
+                products=[
+                    product
+                    for index, product in enumerate(products)
+                    if product_orders[index] in failed_orders
+                    and index not in failed_products
+                ],
+            )
+        errors = []
+        for index, (number, customer, _) in enumerate(orders):
+            message = failed_customers.get(index, failed_orders.get(index))
+            if message is None:
+                self.imported += 1
+                notify_track_changed(customer.id)
+            else:
+                self.failed += 1
+                errors.append(
+                    {"line": number, "errors": get_errors(Exception(message))}
+                )
+        return errors
+
+    @staticmethod
+    async def _delete_orders_async(
+        customers: List[CustomerModel], products: List[ProductModel]
+    ) -> None:
+        """
+        Removes what was written of orders with a failed product, so fixing
+        the line and importing it again does not duplicate them.
+        """
+        await CustomerModel.get_motor_collection().delete_many(
+            {"_id": {"$in": [customer.id for customer in customers]}}
+        )
+        if products:
+            await ProductModel.get_motor_collection().delete_many(
+                {"_id": {"$in": [product.id for product in products]}}
+            )
+
+    async def run_async(
+        self, chunks: AsyncIterator[bytes], max_line_size: int
+    ) -> AsyncIterator[dict]:
+        """
+        Imports the stream and yields the errors of each failed line, then a
+        summary with the number of lines, imported and failed orders.
+        """
+        orders = []
+        async for number, line in iter_lines_async(chunks, max_line_size):
+            if line is not None and not line.strip():
+                continue
+            self.lines += 1
+            try:
+                if line is None:
+                    raise ValueError(
+                        f"La línea excede el tamaño máximo de {max_line_size} bytes."
+                    )
+                orders.append((number, *self._parse(line)))
+            except (ValidationError, ValueError) as e:
+                self.failed += 1
+                yield {"line": number, "errors": get_errors(e)}
+            if len(orders) >= self.batch:
+                for error in await self._write_async(orders):
+                    yield error
+                orders = []
+        if orders:
+            for error in await self._write_async(orders):
+                yield error
+        yield {"lines": self.lines, "imported": self.imported, "failed": self.failed}
+
+
+async def _iter_file_async(path: str, size: int) -> AsyncIterator[bytes]:
+    with sys.stdin.buffer if path == "-" else open(path, "rb") as buffer:
+        for chunk in iter(lambda: buffer.read(size), b""):
+            yield chunk
+
+
+async def _run_async(args: argparse.Namespace) -> None:
+    # Local imports: initializing Beanie needs every module's models.
+    from beanie import init_beanie
+    from config.beanie import db_session as mongo_db_session
+    from atheris_api.modules import models
+
+    mongo_db_session.init()
+    await init_beanie(mongo_db_session.get_database, document_models=[*models])
+    settings = get_settings()
+    order_import = OrderImport(batch=args.batch or settings.IMPORT_BATCH_SIZE)
+    async for result in order_import.run_async(
+        _iter_file_async(args.path, settings.FILE_UPLOAD_CHUNK_SIZE),
+        max_line_size=settings.IMPORT_MAX_LINE_SIZE,
+    ):
+        print(json.dumps(result, ensure_ascii=False))
+
+
+def start():
+    parser = argparse.ArgumentParser(
+        prog="importorders",
+        description="Imports orders from NDJSON, one POST /customer body per line.",
+    )
+    parser.add_argument("path", help="The NDJSON file, or - to read stdin.")
+    parser.add_argument("--batch", type=int, default=0)
+    try:
+        asyncio.run(_run_async(parser.parse_args()))
+    except Exception as e:
+        print(e)
@@ -0,0 +1,68 @@
+# Python imports
+from functools import lru_cache
+import time
+from typing import Optional, Tuple
+
+# Beanie imports
+from beanie import PydanticObjectId
+
+# Own imports
+from config.base_settings import get_settings
+from atheris_api.utils.cache import TTLCache
+
+
+class TrackCache:
+    """
+    Caches the /track answer of each customer for a short time. Writes that
+    change it (an order, a status, a rating) invalidate the customer's entry,
+    and the TTL bounds how stale an answer can be when a write happens in
+    another process.
+
+    :param max_size: the maximum number of customers to keep.
+    :param ttl: the seconds an answer stays valid.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.__cache: TTLCache[Tuple[float, dict]] = TTLCache(max_size, ttl)
+        self.invalidations = 0
+        self.__served_age_total = 0.0
+        self.__served_age_max = 0.0
+
+    def get(self, track: PydanticObjectId) -> Optional[Tuple[dict, float]]:
+        """
+        Returns the cached answer and its age in seconds, or None.
+        """
+        entry = self.__cache.get(track)
+        if entry is None:
+            return None
+        computed_at, track_information = entry
+        age = time.monotonic() - computed_at
+        self.__served_age_total += age
+        self.__served_age_max = max(self.__served_age_max, age)
+        return (track_information, age)
+
+    def set(self, track: PydanticObjectId, track_information: dict) -> None:
+        self.__cache.set(track, (time.monotonic(), track_information))
+
+    def invalidate(self, track: Optional[PydanticObjectId]) -> None:
+        if track is None:
+            return
+        self.invalidations += 1
+        self.__cache.delete(track)
+
+    @property
+    def stats(self) -> dict:
+        stats = self.__cache.stats
+        hits = stats["hits"]
+        return {
+            **stats,
+            "invalidations": self.invalidations,
+            "average_age": self.__served_age_total / hits if hits else 0.0,
+            "max_age": self.__served_age_max,
+        }
+
+
+@lru_cache
+def get_track_cache() -> TrackCache:
+    settings = get_settings()
+    return TrackCache(max_size=settings.TRACK_CACHE_SIZE, ttl=settings.TRACK_CACHE_TTL)
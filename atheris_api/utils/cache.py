@@ -0,0 +1,67 @@
+# Python imports
+from collections import OrderedDict
+import time
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    A bounded in-process cache whose entries expire after a time to live.
+
+    When the cache is full the least recently used entry is evicted. It is
+    meant to be used from the event loop, so it does not lock.
+
+    :param max_size: the maximum number of entries to keep (0 disables it).
+    :param ttl: the seconds an entry stays valid after it was set.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.__entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self.__entries[key]
+            self.misses += 1
+            return None
+        self.__entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        if self.max_size < 1 or self.ttl <= 0:
+            return
+        self.__entries[key] = (time.monotonic() + self.ttl, value)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.__entries.clear()
+
+    @property
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.__entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self.__entries)
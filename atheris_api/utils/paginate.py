@@ -1,29 +1,80 @@
 # Python imports
+import asyncio
+import base64
+import binascii
 import math
-import re
-from typing import List, Tuple, TypeVar, Awaitable
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Awaitable, Union
+
+# BSON imports
+from bson import json_util
+
+# Starlette imports
+from starlette.status import HTTP_400_BAD_REQUEST
 
 # Pydantic imports
 from pydantic import BaseModel
 
+# FastAPI imports
+from fastapi.exceptions import HTTPException
+
 # Beanie imports
 from beanie import Document
 
+# Own imports
+from config.base_settings import get_settings
+from atheris_api.utils.cache import TTLCache
+from atheris_api.utils.search import get_search_query
+
 
 T = TypeVar("T", bound=Document)
 
+_count_caches: Dict[str, TTLCache[int]] = {}
+
+
+def get_count_cache(cls: T) -> TTLCache[int]:
+    """
+    Returns the cache of list counts of a model, keyed by query.
+    """
+    cache = _count_caches.get(cls.__name__)
+    if cache is None:
+        settings = get_settings()
+        cache = _count_caches[cls.__name__] = TTLCache(
+            max_size=settings.PAGINATION_COUNT_CACHE_SIZE,
+            ttl=settings.PAGINATION_COUNT_CACHE_TTL,
+        )
+    return cache
+
+
+def invalidate_counts(cls: T) -> None:
+    """
+    Forgets the cached counts of a model. Models call it after every write
+    that can change a count. Writes made by other processes are only seen
+    once the TTL expires.
+    """
+    get_count_cache(cls).clear()
+
+
+def get_count_stats() -> Dict[str, dict]:
+    """
+    Returns the size, hits, misses and hit ratio of each model's count cache.
+    """
+    return {name: cache.stats for name, cache in _count_caches.items()}
+
 
 class PaginatedListSchema(BaseModel):
     """
     Represents a response that contains information about the total number of
     records found, the number of possible pages, the current page number and
-    the limit per page.
+    the limit per page. total and num_pages are None when the total was not
+    requested. next is an opaque cursor for the following page, or None on
+    the last page.
     """
 
-    total: int
-    num_pages: int
+    total: Optional[int]
+    num_pages: Optional[int]
     current_page: int
     per_page: int
+    next: Optional[str] = None
 
 
 class PaginatedRequest:
@@ -38,44 +89,148 @@ class PaginatedRequest:
         search: str,
         limit: int,
         page: int,
-    ) -> Awaitable[Tuple[PaginatedListSchema, List[T]]]:
+        with_total: bool = True,
+        cursor: Optional[str] = None,
+        sort_field: str = "_id",
+        projection: Optional[List[str]] = None,
+    ) -> Awaitable[Tuple[PaginatedListSchema, List[Union[T, Dict]]]]:
         """
         Returns a tuple of PaginatedListSchema and a list of objects of type T.
 
         :param cls: the class or subclass of Document to search.
-        :param field: the field to search for.
-        :param search: the search term to use.
+        :param field: the field to search for. The model must maintain its search fields (see atheris_api.utils.search).
+        :param search: the search term to use. It matches substrings ignoring case and accents.
         :param limit: the maximum number of documents to return.
         :param page: the page number (optional). If specified, it will calculate the new skip value.
-        :return: a tuple containing a PaginatedListSchema and a list of objects of type T.
+        :param with_total: whether to count the matching documents. The page and the count are fetched concurrently, and unfiltered listings use the collection's estimated count.
+        :param cursor: the next token of a previous page. If specified, the page continues after it instead of skipping documents, and page is only echoed back.
+        :param sort_field: the field the documents are ordered by (ties are broken by _id).
+        :param projection: the fields to fetch. If specified, the documents are returned as raw dicts ready to be serialized (with _id as a string, as the list schemas serialize it) instead of objects of type T.
+        :return: a tuple containing a PaginatedListSchema and a list of objects of type T (or dicts).
         """
         if limit < 1:
             limit = 1
         if limit > 100:
             limit = 100
+        if page < 1:
+            page = 1
         skip = (page - 1) * limit
-        query = (
-            {}
-            if len(search.strip()) < 3
-            else {f"{field}": {"$regex": f"{re.escape(search)}", "$options": "i"}}
-        )
-        results = await cls.find(query).skip(skip).limit(limit).to_list()
-        total = await cls.find(query).count()
-        return self._get_paginated_response(total, skip, limit, results)
+        query = get_search_query(field, search)
+        page_query = query
+        page_skip = skip
+        if cursor:
+            cursor_query = self._get_cursor_query(sort_field, cursor)
+            page_query = {"$and": [query, cursor_query]} if query else cursor_query
+            page_skip = 0
+        elif page > get_settings().PAGINATION_MAX_OFFSET_PAGE:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail=[
+                    {
+                        "field": "page",
+                        "msg": "La página solicitada es demasiado profunda, utilice el cursor next.",
+                    }
+                ],
+            )
+        sort = [("_id", 1)] if sort_field == "_id" else [(sort_field, 1), ("_id", 1)]
+        if projection is None:
+            find = cls.find(page_query).sort(sort).skip(page_skip).limit(limit + 1)
+            find = find.to_list()
+        else:
+            fields = {name: 1 for name in [*projection, sort_field]}
+            find = cls.get_motor_collection().find(page_query, fields).sort(sort)
+            find = find.skip(page_skip).limit(limit + 1).to_list(length=None)
+        if not with_total:
+            results = await find
+            total = None
+        else:
+            results, total = await asyncio.gather(find, self._count_async(cls, query))
+        next = None
+        if len(results) > limit:
+            results = results[:limit]
+            next = self._encode_cursor(sort_field, results[-1])
+        if projection is not None:
+            for result in results:
+                result["_id"] = f"{result['_id']}"
+        return self._get_paginated_response(total, skip, limit, results, next)
+
+    def _encode_cursor(self, sort_field: str, document: Union[Document, Dict]) -> str:
+        """
+        Returns an opaque token with the position of document in the ordering.
+        """
+        if isinstance(document, dict):
+            position = {"f": sort_field, "id": document["_id"]}
+            if sort_field != "_id":
+                position["v"] = document.get(sort_field)
+        else:
+            position = {"f": sort_field, "id": document.id}
+            if sort_field != "_id":
+                position["v"] = getattr(document, sort_field)
+        return base64.urlsafe_b64encode(json_util.dumps(position).encode()).decode()
+
+    def _get_cursor_query(self, sort_field: str, cursor: str) -> dict:
+        """
+        Returns the query matching the documents that come after cursor.
+        """
+        try:
+            position: Any = json_util.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if position.get("f") != sort_field or "id" not in position:
+                raise ValueError(cursor)
+        except (ValueError, TypeError, AttributeError, binascii.Error):
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail=[{"field": "cursor", "msg": "El cursor no es válido."}],
+            )
+        if sort_field == "_id":
+            return {"_id": {"$gt": position["id"]}}
+        return {
+            "$or": [
+                {sort_field: {"$gt": position.get("v")}},
+                {sort_field: position.get("v"), "_id": {"$gt": position["id"]}},
+            ]
+        }
+
+    async def _count_async(self, cls: T, query: dict) -> int:
+        """
+        Returns the number of documents matching query. Counts are cached until
+        the model invalidates them, and unfiltered counts use the collection
+        metadata instead of scanning the collection.
+
+        :param cls: the class or subclass of Document to count.
+        :param query: the query to count.
+        :return: the number of documents.
+        """
+        cache = get_count_cache(cls)
+        key = json_util.dumps(query)
+        total = cache.get(key)
+        if total is not None:
+            return total
+        if not query:
+            total = await cls.get_motor_collection().estimated_document_count()
+        else:
+            total = await cls.find(query).count()
+        cache.set(key, total)
+        return total
 
     def _get_paginated_response(
-        self, total: int, skip: int, limit: int, results: List[T]
-    ) -> Tuple[PaginatedListSchema, List[T]]:
+        self,
+        total: Optional[int],
+        skip: int,
+        limit: int,
+        results: List[Union[T, Dict]],
+        next: Optional[str] = None,
+    ) -> Tuple[PaginatedListSchema, List[Union[T, Dict]]]:
         """
         Returns a tuple of PaginatedListSchema and a list of objects of type T.
 
-        :param total: the total number of documents.
+        :param total: the total number of documents, or None if it was not counted.
         :param skip: the number of documents to skip.
         :param limit: the maximum number of documents to return.
         :param results: a list of objects of type T.
+        :param next: the cursor of the following page, if any.
         :return: a tuple containing a PaginatedListSchema and a list of objects of type T.
         """
-        num_pages = math.ceil(total / limit)
+        num_pages = None if total is None else math.ceil(total / limit)
         current_page = int(skip / limit) + 1
         return (
             PaginatedListSchema(
@@ -83,6 +238,7 @@ class PaginatedRequest:
                 num_pages=num_pages,
                 current_page=current_page,
                 per_page=limit,
+                next=next,
             ),
             results,
         )
@@ -1,9 +1,20 @@
 # Python imports
 from enum import Enum
+from functools import lru_cache
+import os
 import re
-import nltk
+from typing import Callable, Dict, List
 
-nltk.download("punkt")
+# Own imports
+from atheris_api.utils.startup import mark
+
+WHITESPACE_REGEX = re.compile(r"(\s)+")
+
+SENTENCE_END_REGEX = re.compile(r"[.!?]")
+
+SENTENCE_SPLIT_REGEX = re.compile(r"(?<=[.!?])\s+")
+
+NLTK_DATA_PATH = os.path.join(os.getcwd(), "nltk_data")
 
 
 class RegexEnum(Enum):
@@ -33,41 +44,122 @@ class RegexEnum(Enum):
     }
 
 
-class RegexValidators:
+@lru_cache
+def get_sentence_tokenizer() -> Callable[[str], List[str]]:
+    """
+    Returns the NLTK sentence tokenizer, importing NLTK on first use. The
+    punkt data is looked up in the bundled nltk_data directory and then in
+    NLTK's own paths (e.g. $NLTK_DATA); it is never downloaded at runtime.
+    Without it, sentences are split after . ! and ?.
+    """
+    import nltk
+
+    if NLTK_DATA_PATH not in nltk.data.path:
+        nltk.data.path.insert(0, NLTK_DATA_PATH)
+    try:
+        nltk.data.find("tokenizers/punkt")
+    except LookupError:
+        print(
+            f"NLTK punkt data not found in {nltk.data.path}, run downloadnltk. "
+            "Splitting sentences on punctuation instead."
+        )
+        return SENTENCE_SPLIT_REGEX.split
+    return nltk.sent_tokenize
+
+
+class RegexValidator:
+    """
+    A RegexEnum pattern compiled once, shared by every validation of it.
+
+    Values are formatted before matching: whitespace is collapsed and each
+    sentence is capitalized. Only free text with sentence punctuation goes
+    through the NLTK tokenizer; any other value is a single sentence, so it
+    is capitalized directly.
+
+    :param regex: the pattern and message to validate with.
+    :param flags: the flags the pattern is compiled with.
+    :param sentences: whether values may hold several sentences.
+    """
+
     def __init__(
         self,
         regex: RegexEnum,
-        value: str,
-        optional: bool = False,
         flags: tuple[re.RegexFlag] = (re.IGNORECASE,),
+        sentences: bool = True,
     ):
-        self.regex = regex.value.get("regex")
-        self.value = value
-        self.message = regex.value.get("msg")
-        self.optional = optional
-        self.flags = flags
+        self.pattern: re.Pattern[str] = re.compile(regex.value.get("regex"), *flags)
+        self.message: str = regex.value.get("msg")
+        self.sentences = sentences
 
-    def capitalize_sentences(self, text):
-        sentences = nltk.sent_tokenize(text)
+    def capitalize_sentences(self, text: str) -> str:
+        if not self.sentences or SENTENCE_END_REGEX.search(text) is None:
+            return text.capitalize()
+        sentences = get_sentence_tokenizer()(text)
         capitalized_sentences = [sentence.capitalize() for sentence in sentences]
         return " ".join(capitalized_sentences)
 
-    def getFormatText(self, value):
-        whitespace_regex: re.Pattern[str] = re.compile(r"(\s)+")
-        return re.sub(whitespace_regex, " ", value).strip()
+    @staticmethod
+    def get_format_text(value: str) -> str:
+        return WHITESPACE_REGEX.sub(" ", value).strip()
 
-    @property
-    def validate(self):
-        regex_test: re.Pattern[str] = re.compile(self.regex, *self.flags)
-        value = self.capitalize_sentences(self.getFormatText(self.value))
-        if self.optional:
-            return {
-                "match": value == "" or regex_test.match(value) is not None,
-                "value": value,
-                "message": self.message,
-            }
+    def validate(self, value: str, optional: bool = False) -> dict:
+        value = self.capitalize_sentences(self.get_format_text(value))
+        match = self.pattern.match(value) is not None
         return {
-            "match": regex_test.match(value) is not None,
+            "match": match or (optional and value == ""),
             "value": value,
             "message": self.message,
         }
+
+
+SENTENCE_REGEXES = (RegexEnum.WORD, RegexEnum.ADDRESS, RegexEnum.TEXT)
+
+VALIDATORS: Dict[RegexEnum, RegexValidator] = {
+    regex: RegexValidator(regex, sentences=regex in SENTENCE_REGEXES)
+    for regex in RegexEnum
+}
+
+
+def get_validator(regex: RegexEnum) -> RegexValidator:
+    return VALIDATORS[regex]
+
+
+class RegexValidators:
+    """
+    Kept for callers of the former per-call API; it delegates to the
+    precompiled validator of regex.
+    """
+
+    def __init__(
+        self,
+        regex: RegexEnum,
+        value: str,
+        optional: bool = False,
+        flags: tuple[re.RegexFlag] = (re.IGNORECASE,),
+    ):
+        self.validator = (
+            VALIDATORS[regex]
+            if flags == (re.IGNORECASE,)
+            else RegexValidator(regex, flags, sentences=regex in SENTENCE_REGEXES)
+        )
+        self.value = value
+        self.message = self.validator.message
+        self.optional = optional
+
+    @property
+    def validate(self):
+        return self.validator.validate(self.value, optional=self.optional)
+
+
+def download():
+    """
+    Provisions the punkt data in the bundled nltk_data directory, so the API
+    starts without network access.
+    """
+    import nltk
+
+    if not nltk.download("punkt", download_dir=NLTK_DATA_PATH):
+        raise SystemExit(1)
+
+
+mark("atheris_api.utils.regex")
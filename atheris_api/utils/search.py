@@ -0,0 +1,63 @@
+# Python imports
+import re
+import unicodedata
+from typing import List
+
+WHITESPACE_REGEX = re.compile(r"\s+")
+
+MIN_SEARCH_LENGTH = 3
+
+
+def fold(text: str) -> str:
+    """
+    Returns text lowercased, without accents and with its whitespace collapsed,
+    so "Camisá  Roja" and "camisa roja" fold to the same key.
+
+    :param text: the text to fold.
+    :return: the folded text.
+    """
+    decomposed = unicodedata.normalize("NFKD", f"{text}")
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return WHITESPACE_REGEX.sub(" ", stripped).strip().lower()
+
+
+def get_trigrams(folded: str) -> List[str]:
+    """
+    Returns the distinct three-character substrings of a folded text, which
+    are stored in a multikey index to answer substring searches.
+
+    :param folded: a text already folded with fold.
+    :return: the sorted trigrams.
+    """
+    return sorted({folded[i : i + 3] for i in range(len(folded) - 2)})
+
+
+def get_search_fields(field: str, value: str) -> dict:
+    """
+    Returns the search fields maintained next to a searchable field.
+
+    :param field: the name of the searchable field (e.g. title).
+    :param value: the value of the searchable field.
+    :return: a dict with the <field>_folded and <field>_trigrams values.
+    """
+    folded = fold(value)
+    return {f"{field}_folded": folded, f"{field}_trigrams": get_trigrams(folded)}
+
+
+def get_search_query(field: str, search: str) -> dict:
+    """
+    Returns a query matching the documents whose field contains search,
+    ignoring case and accents. The trigrams narrow the candidates through the
+    multikey index and the regex on the folded key confirms the substring.
+
+    :param field: the name of the searchable field (e.g. title).
+    :param search: the search term.
+    :return: the query, or an empty query for terms shorter than three characters.
+    """
+    folded = fold(search)
+    if len(folded) < MIN_SEARCH_LENGTH:
+        return {}
+    return {
+        f"{field}_trigrams": {"$all": get_trigrams(folded)},
+        f"{field}_folded": {"$regex": re.escape(folded)},
+    }
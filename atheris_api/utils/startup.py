@@ -0,0 +1,26 @@
+# Python imports
+import time
+from typing import Dict
+
+STARTED_AT = time.perf_counter()
+
+marks: Dict[str, float] = {}
+
+
+def mark(name: str) -> None:
+    """
+    Records the seconds elapsed since the atheris_api package began importing.
+
+    :param name: the step that just finished (e.g. a module name).
+    """
+    marks[name] = time.perf_counter() - STARTED_AT
+
+
+def get_report() -> str:
+    """
+    Returns the recorded steps in order, with the elapsed milliseconds.
+    """
+    steps = ", ".join(
+        f"{name} {seconds * 1000:.0f} ms" for name, seconds in marks.items()
+    )
+    return f"Startup: {steps}."
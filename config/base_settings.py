@@ -10,12 +10,66 @@ class Settings(BaseSettings):
         DATA_UPLOAD_MAX_MEMORY_SIZE (int): An integer representing the maximum file size during data upload.
         ALLOWED_MIME_TYPES (str): A string representing the allowed MIME types (e.g. 'image/png,image/jpeg' for images).
         ORIGINS (str): A string representing the allowed origins for CORS (e.g. 'http://localhost:8080,http://127.0.0.1:8080' for localhost).
+        FILE_UPLOAD_CHUNK_SIZE (int): An integer representing the size in bytes of each block read, hashed and written during a file upload.
+        FILE_VERIFICATION_CACHE_SIZE (int): An integer representing the maximum number of verified files remembered before the least recently used is evicted.
+        FILE_VERIFICATION_INTERVAL (int): An integer representing the seconds after which an unchanged file is hashed again (0 disables it).
+        FILE_STORAGE_SHARD_DEPTH (int): An integer representing the number of nested directory levels used to store uploaded files (0 keeps a flat directory).
+        FILE_STORAGE_SHARD_WIDTH (int): An integer representing the number of hash characters used to name each directory level.
+        FILE_RECORD_CACHE_SIZE (int): An integer representing the maximum number of file records kept in memory after a hash lookup.
+        FILE_RECORD_CACHE_TTL (int): An integer representing the seconds a cached file record stays valid (0 disables the cache).
+        FILE_DERIVATIVE_WIDTHS (str): A string representing the widths in pixels rendered for uploaded images (e.g. '480,960,1440'). Requires Pillow.
+        FILE_DERIVATIVE_FORMATS (str): A string representing the formats rendered for each width (e.g. 'webp,jpeg').
+        FILE_DERIVATIVE_WORKERS (int): An integer representing the number of processes used to render image derivatives.
+        FILE_UPLOAD_MAX_CHUNK_SIZE (int): An integer representing the maximum size in bytes of each chunk of a resumable upload.
+        FILE_SCRUB_ENABLED (bool): A boolean indicating whether the background integrity scrubber runs.
+        FILE_SCRUB_RATE (int): An integer representing the maximum bytes per second read by the scrubber (0 disables the limit).
+        FILE_SCRUB_INTERVAL (int): An integer representing the seconds the scrubber waits between passes.
+        FILE_SCRUB_LEASE (int): An integer representing the seconds a worker holds the scrubber lease before another may take over. It is renewed before each file is scrubbed.
+        FILE_SCRUB_TRUST_SECONDS (int): An integer representing how long read_slide trusts an intact scrub result instead of hashing (0 disables it).
+        FILE_ACCEL_REDIRECT_PREFIX (str): A string representing the internal nginx location that serves the uploads directory (e.g. '/protected_uploads/'). When set, read_slide answers with an X-Accel-Redirect header instead of streaming the file.
+        FILE_BATCH_CONCURRENCY (int): An integer representing the maximum number of files of a batch upload processed at the same time.
+        PAGINATION_MAX_OFFSET_PAGE (int): An integer representing the deepest page a list endpoint serves by offset; deeper pages must use the next cursor.
+        PAGINATION_COUNT_CACHE_SIZE (int): An integer representing the maximum number of list counts remembered per collection.
+        PAGINATION_COUNT_CACHE_TTL (int): An integer representing the seconds a list count stays valid when no write invalidates it first (0 disables the cache).
+        DATABASE_TRANSACTIONS (bool): A boolean indicating whether an order's customer and products are written in one transaction. Requires MongoDB to run as a replica set.
+        TRACK_CACHE_SIZE (int): An integer representing the maximum number of /track answers kept in memory.
+        TRACK_CACHE_TTL (int): An integer representing the seconds a /track answer stays valid when no write invalidates it first (0 disables the cache).
+        TRACK_CHANGE_STREAM_ENABLED (bool): A boolean indicating whether MongoDB change streams feed the /track/events streams, so writes from other processes reach them too. Requires MongoDB to run as a replica set.
+        IMPORT_BATCH_SIZE (int): An integer representing the maximum number of orders an NDJSON import writes per insert_many.
+        IMPORT_MAX_LINE_SIZE (int): An integer representing the maximum size in bytes of an NDJSON import line.
     """
 
     DATABASE_URL: str
     DATA_UPLOAD_MAX_MEMORY_SIZE: int
     ALLOWED_MIME_TYPES: str
     ORIGINS: str
+    FILE_UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+    FILE_VERIFICATION_CACHE_SIZE: int = 4096
+    FILE_VERIFICATION_INTERVAL: int = 0
+    FILE_STORAGE_SHARD_DEPTH: int = 2
+    FILE_STORAGE_SHARD_WIDTH: int = 2
+    FILE_RECORD_CACHE_SIZE: int = 1024
+    FILE_RECORD_CACHE_TTL: int = 300
+    FILE_DERIVATIVE_WIDTHS: str = "480,960,1440"
+    FILE_DERIVATIVE_FORMATS: str = "webp,jpeg"
+    FILE_DERIVATIVE_WORKERS: int = 2
+    FILE_UPLOAD_MAX_CHUNK_SIZE: int = 8 * 1024 * 1024
+    FILE_SCRUB_ENABLED: bool = False
+    FILE_SCRUB_RATE: int = 4 * 1024 * 1024
+    FILE_SCRUB_INTERVAL: int = 60 * 60
+    FILE_SCRUB_LEASE: int = 10 * 60
+    FILE_SCRUB_TRUST_SECONDS: int = 0
+    FILE_ACCEL_REDIRECT_PREFIX: str = ""
+    FILE_BATCH_CONCURRENCY: int = 4
+    PAGINATION_MAX_OFFSET_PAGE: int = 100
+    PAGINATION_COUNT_CACHE_SIZE: int = 256
+    PAGINATION_COUNT_CACHE_TTL: int = 60
+    DATABASE_TRANSACTIONS: bool = False
+    TRACK_CACHE_SIZE: int = 4096
+    TRACK_CACHE_TTL: int = 10
+    TRACK_CHANGE_STREAM_ENABLED: bool = False
+    IMPORT_BATCH_SIZE: int = 500
+    IMPORT_MAX_LINE_SIZE: int = 1024 * 1024
 
     class Config:
         """A class for configuration settings.
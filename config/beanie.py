@@ -1,4 +1,11 @@
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorClientSession,
+    AsyncIOMotorDatabase,
+)
 from config.base_settings import get_settings
 
 
@@ -27,6 +34,23 @@ class DatabaseSessionAsync:
             )
         return self._engine.get_default_database()
 
+    @asynccontextmanager
+    async def start_transaction(self) -> AsyncIterator[AsyncIOMotorClientSession]:
+        """Yields a session whose operations are committed together when the
+        block exits, or aborted if it raises. Requires a replica set.
+
+        Raises:
+            Exception: If the engine object has not been initialized.
+        """
+        if self._engine is None:
+            raise Exception(
+                "The value of the engine object is None, please execute the init method "
+                "to initialize the engine object."
+            )
+        async with await self._engine.start_session() as session:
+            async with session.start_transaction():
+                yield session
+
     def init(self) -> None:
         """Initialize the engine object with the database configuration.
 
@@ -0,0 +1,26 @@
+# Python imports
+import os
+import unittest
+
+os.environ.setdefault("DATABASE_URL", "mongodb://localhost:27017/atheris")
+os.environ.setdefault("DATA_UPLOAD_MAX_MEMORY_SIZE", "5242880")
+os.environ.setdefault("ALLOWED_MIME_TYPES", "image/png,image/jpeg")
+os.environ.setdefault("ORIGINS", "*")
+
+
+class MongoTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Initializes Beanie against an in-memory mongomock database before each
+    test, and clears the in-process caches.
+    """
+
+    async def asyncSetUp(self):
+        # Local imports: the settings above must be set before the app imports.
+        from beanie import init_beanie
+        from mongomock_motor import AsyncMongoMockClient
+        from atheris_api.modules import models
+        from atheris_api.modules.product.utils.track import get_track_cache
+
+        get_track_cache.cache_clear()
+        self.database = AsyncMongoMockClient()["atheris"]
+        await init_beanie(database=self.database, document_models=[*models])
@@ -0,0 +1,82 @@
+# Python imports
+import io
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+# PyMongo imports
+from pymongo.errors import BulkWriteError
+
+# Starlette imports
+from starlette.datastructures import Headers, UploadFile
+
+# Own imports
+from atheris_api.modules.file.models.file import FileModel
+from atheris_api.modules.file.schemas.file import FileBatchStatusEnum
+from atheris_api.modules.file.utils import batch as batch_utils
+from atheris_api.modules.file.utils import file as file_utils
+from atheris_api.modules.file.utils.batch import FileBatch
+from atheris_api.modules.file.utils.file import FileUploadDirectoryEnum
+from atheris_api.modules.file.utils.storage import FileStorage
+from . import MongoTestCase
+
+
+def get_upload_file(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(
+        file=io.BytesIO(content),
+        size=len(content),
+        filename=filename,
+        headers=Headers({"content-type": "image/png"}),
+    )
+
+
+class FileBatchTestCase(MongoTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        storage = FileStorage(dir=[directory.name])
+        for module in (batch_utils, file_utils):
+            get_storage = patch.object(module, "get_storage", return_value=storage)
+            get_storage.start()
+            self.addCleanup(get_storage.stop)
+        derivatives = patch.object(
+            batch_utils, "create_derivatives_async", AsyncMock(return_value=[])
+        )
+        derivatives.start()
+        self.addCleanup(derivatives.stop)
+
+    async def test_write_errors(self):
+        write_errors = {
+            "writeErrors": [
+                {"index": 0, "code": 11000, "errmsg": "E11000 duplicate key"},
+                {"index": 1, "code": 121, "errmsg": "Document failed validation"},
+            ]
+        }
+        batch = FileBatch(
+            files=[
+                get_upload_file("a.png", b"a"),
+                get_upload_file("b.png", b"b"),
+                get_upload_file("c.png", b"c"),
+            ],
+            dir=FileUploadDirectoryEnum.SLIDES,
+        )
+        with patch.object(
+            FileModel,
+            "insert_many",
+            AsyncMock(side_effect=BulkWriteError(write_errors)),
+        ):
+            results = await batch.save_async()
+        self.assertEqual(
+            [result.status for result in results],
+            [
+                FileBatchStatusEnum.EXISTS,
+                FileBatchStatusEnum.ERROR,
+                FileBatchStatusEnum.CREATED,
+            ],
+        )
+        self.assertIsNotNone(results[1].msg)
+
+
+if __name__ == "__main__":
+    unittest.main()
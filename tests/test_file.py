@@ -0,0 +1,70 @@
+# Python imports
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+# FastAPI imports
+from fastapi.exceptions import HTTPException
+
+# Own imports
+from atheris_api.modules.file.models.file import FileModel
+from atheris_api.modules.file.utils import file as file_utils
+from atheris_api.modules.file.utils.file import (
+    FileUploadDirectoryEnum,
+    Files,
+    get_verification_cache,
+)
+from atheris_api.modules.file.utils.storage import FileStorage
+from . import MongoTestCase
+
+
+class ValidatedPathTestCase(MongoTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.storage = FileStorage(dir=[directory.name])
+        sha256 = hashlib.sha256(b"banner").hexdigest()
+        self.file = FileModel(
+            sha256=sha256, md5=hashlib.md5(sha256.encode()).hexdigest(), ext=".png"
+        )
+        self.path = path = self.storage.get_path(
+            self.storage.get_name(sha256=sha256, md5=self.file.md5, ext=".png")
+        )
+        os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as buffer:
+            buffer.write(b"banner")
+        get_verification_cache().clear()
+        self.addCleanup(get_verification_cache().clear)
+
+    async def test_cache_hit_skips_scrub_results(self):
+        trusted_signature = AsyncMock(return_value=None)
+        with patch.object(
+            file_utils, "get_storage", return_value=self.storage
+        ), patch.object(Files, "_get_trusted_signature_async", trusted_signature):
+            first = await Files.get_validated_path_async(
+                file=self.file, dir=FileUploadDirectoryEnum.SLIDES
+            )
+            second = await Files.get_validated_path_async(
+                file=self.file, dir=FileUploadDirectoryEnum.SLIDES
+            )
+        self.assertEqual(first, second)
+        trusted_signature.assert_awaited_once()
+
+    async def test_file_removed_while_resolved(self):
+        os.remove(self.path)
+        legacy_path = self.storage.get_legacy_path(os.path.basename(self.path))
+        with patch.object(
+            file_utils, "get_storage", return_value=self.storage
+        ), patch.object(self.storage, "resolve_path", return_value=legacy_path):
+            with self.assertRaises(HTTPException) as context:
+                await Files.get_validated_path_async(
+                    file=self.file, dir=FileUploadDirectoryEnum.SLIDES
+                )
+        self.assertEqual(context.exception.status_code, 410)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# Python imports
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Own imports
+from atheris_api.modules.file.models.file import FileModel
+from atheris_api.modules.file.utils import gc as gc_utils
+from atheris_api.modules.file.utils.file import FileUploadDirectoryEnum, get_slide_url
+from atheris_api.modules.file.utils.gc import FileGarbageCollector
+from atheris_api.modules.file.utils.storage import FileStorage
+from atheris_api.modules.home.models.home import ProductSlideModel
+from . import MongoTestCase
+
+
+class FileGarbageCollectorTestCase(MongoTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        storages = {
+            dir: FileStorage(dir=[directory.name, dir.name.lower()])
+            for dir in FileUploadDirectoryEnum
+        }
+        get_storage = patch.object(gc_utils, "get_storage", side_effect=storages.get)
+        get_storage.start()
+        self.addCleanup(get_storage.stop)
+        self.storage = storages[FileUploadDirectoryEnum.SLIDES]
+
+    async def create_file(self, content: bytes) -> FileModel:
+        sha256 = hashlib.sha256(content).hexdigest()
+        file = FileModel(
+            sha256=sha256, md5=hashlib.md5(sha256.encode()).hexdigest(), ext=".png"
+        )
+        self.write(self.storage.get_name(sha256=sha256, md5=file.md5, ext=".png"))
+        await FileModel.insert_one(file)
+        return file
+
+    def write(self, name: str) -> None:
+        path = self.storage.get_path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as buffer:
+            buffer.write(b"")
+
+    async def test_report(self):
+        banner = await self.create_file(b"banner")
+        orphan = await self.create_file(b"orphan")
+        await ProductSlideModel.get_motor_collection().insert_one(
+            {"title": "Camisetas", "banner": get_slide_url(banner.md5)}
+        )
+        self.write("unknown.png")
+        collector = FileGarbageCollector(dry_run=True, grace=-60, batch=1)
+        report = await collector.run_async()
+        self.assertEqual(report["samples"]["orphan_records"], [orphan.md5])
+        self.assertEqual(report["samples"]["orphan_files"], ["un/kn/unknown.png"])
+        self.assertNotIn("dangling_records", report["counts"])
+        self.assertEqual(await FileModel.find_all().count(), 2)
+        database = FileModel.get_motor_collection().database
+        names = await database.list_collection_names()
+        self.assertFalse([name for name in names if name.startswith("gcKnownNames")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+# Python imports
+import json
+import unittest
+
+# Own imports
+from atheris_api.modules.product.models.product import CustomerModel, ProductModel
+from atheris_api.modules.product.utils.importer import OrderImport
+from .test_order import CUSTOMER, PRODUCT
+from . import MongoTestCase
+
+
+class OrderImportTestCase(MongoTestCase):
+    async def import_orders(self, *orders: dict) -> list:
+        async def chunks():
+            for order in orders:
+                yield json.dumps(order).encode() + b"\n"
+
+        return [
+            result
+            async for result in OrderImport(batch=10).run_async(
+                chunks(), max_line_size=4096
+            )
+        ]
+
+    async def test_import(self):
+        results = await self.import_orders(
+            {"customer": CUSTOMER, "productList": [PRODUCT, PRODUCT]},
+            {"customer": CUSTOMER},
+        )
+        self.assertEqual(results, [{"lines": 2, "imported": 2, "failed": 0}])
+        self.assertEqual(await CustomerModel.find_all().count(), 2)
+        self.assertEqual(await ProductModel.find_all().count(), 2)
+
+    async def test_failed_product_is_reported_by_line(self):
+        collection = ProductModel.get_motor_collection()
+        await collection.create_index("primary_color", unique=True)
+        await collection.insert_one({"primary_color": "rojo"})
+        results = await self.import_orders(
+            {"customer": CUSTOMER, "productList": [PRODUCT]},
+            {
+                "customer": CUSTOMER,
+                "productList": [{**PRODUCT, "primaryColor": "rojo"}],
+            },
+        )
+        self.assertEqual([result.get("line") for result in results], [2, None])
+        self.assertEqual(results[-1], {"lines": 2, "imported": 1, "failed": 1})
+        self.assertEqual(await collection.count_documents({}), 2)
+
+    async def test_failed_product_removes_its_order(self):
+        collection = ProductModel.get_motor_collection()
+        await collection.create_index("primary_color", unique=True)
+        await collection.insert_one({"primary_color": "rojo"})
+        results = await self.import_orders(
+            {"customer": CUSTOMER, "productList": [PRODUCT]},
+            {
+                "customer": {**CUSTOMER, "names": "ana gomez"},
+                "productList": [
+                    {**PRODUCT, "primaryColor": "azul"},
+                    {**PRODUCT, "primaryColor": "rojo"},
+                ],
+            },
+        )
+        self.assertEqual(results[-1], {"lines": 2, "imported": 1, "failed": 1})
+        customers = await CustomerModel.find_all().to_list()
+        self.assertEqual([customer.names for customer in customers], ["Juan perez"])
+        colors = await collection.distinct("primary_color")
+        self.assertEqual(sorted(colors), ["negro", "rojo"])
+
+
+if __name__ == "__main__":
+    unittest.main()
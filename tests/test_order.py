@@ -0,0 +1,63 @@
+# Python imports
+import json
+import unittest
+
+# Beanie imports
+from beanie import PydanticObjectId
+
+# Own imports
+from atheris_api.modules.product.models.product import CustomerModel, ProductModel
+from atheris_api.modules.product.schemas.product import CustomerSchema, ProductSchema
+from atheris_api.modules.product.services.product import ProductRequest
+from . import MongoTestCase
+
+CUSTOMER = {
+    "documentNumber": "1234567890",
+    "names": "juan perez",
+    "cellPhoneNumber": "3001234567",
+    "email": "juan.perez@example.info",
+    "city": "bogota",
+    "address": "calle 10 # 20-30",
+}
+
+PRODUCT = {
+    "primaryColor": "negro",
+    "secondColor": "blanco",
+    "chestWidth": 50,
+    "waistWidth": 45,
+    "neckToHipHeight": 70,
+    "sleeveLengthShirt": 20,
+    "sleeveLengthHoodie": 60,
+    "age": 30,
+    "height": 175,
+    "weight": 70,
+    "shoeSize": 42,
+    "bodyType": 1,
+}
+
+
+class OrderTestCase(MongoTestCase):
+    async def create_order(self, products: int) -> PydanticObjectId:
+        response = await ProductRequest().create_async(
+            customer=CustomerSchema.parse_obj(CUSTOMER),
+            productList=[ProductSchema.parse_obj(PRODUCT) for _ in range(products)],
+        )
+        self.assertEqual(response.status_code, 200)
+        return PydanticObjectId(json.loads(response.body)["hash"])
+
+    async def test_create_order(self):
+        track = await self.create_order(products=3)
+        customer = await CustomerModel.get(track)
+        self.assertEqual(customer.names, "Juan perez")
+        products = await ProductModel.find_all().to_list()
+        # mongomock cannot query customer.$id, so the references are compared here.
+        self.assertEqual([product.customer.ref.id for product in products], [track] * 3)
+
+    async def test_create_order_without_products(self):
+        track = await self.create_order(products=0)
+        self.assertIsNotNone(await CustomerModel.get(track))
+        self.assertEqual(await ProductModel.find_all().count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+# Python imports
+import json
+import unittest
+
+# FastAPI imports
+from fastapi.exceptions import HTTPException
+
+# Own imports
+from atheris_api.modules.file.models.file import FileModel
+from atheris_api.modules.home.models.home import ProductSlideModel
+from atheris_api.modules.home.schemas.home import ProductSlideListSchema
+from atheris_api.modules.home.services.home import HomeRequest
+from . import MongoTestCase
+
+MD5 = "0cc175b9c0f1b6a831c399e269772661"
+
+SLIDE_INFO = json.dumps(
+    {"slide_title": "Comodidad", "slide_desc": "Sin costuras", "specifications": []}
+)
+
+
+class ProductSlideTestCase(MongoTestCase):
+    async def create_product_slide(self, md5: str):
+        return await HomeRequest().create_product_slide_async(
+            title="Camisetas",
+            desc="¡Nuestras mejores prendas!",
+            slideInfo=SLIDE_INFO,
+            file=None,
+            md5=md5,
+        )
+
+    async def test_create_from_uploaded_banner(self):
+        await FileModel.insert_one(FileModel(sha256="a" * 64, md5=MD5, ext=".png"))
+        response = await self.create_product_slide(md5=MD5.upper())
+        self.assertEqual(response.status_code, 201)
+        product_slide = await ProductSlideModel.find_one()
+        self.assertEqual(product_slide.banner, f"/read_slide?hash={MD5}")
+
+    async def test_create_from_unknown_banner(self):
+        with self.assertRaises(HTTPException) as context:
+            await self.create_product_slide(md5=MD5)
+        self.assertEqual(context.exception.status_code, 404)
+        self.assertEqual(await ProductSlideModel.find_all().count(), 0)
+
+    async def test_list_keeps_id(self):
+        await FileModel.insert_one(FileModel(sha256="a" * 64, md5=MD5, ext=".png"))
+        await self.create_product_slide(md5=MD5)
+        product_slide = await ProductSlideModel.find_one()
+        response = await HomeRequest().get_async(count=False)
+        content = json.loads(response.body)
+        self.assertEqual(
+            [result["_id"] for result in content["results"]], [f"{product_slide.id}"]
+        )
+        # The raw rows are what the declared response_model would serialize.
+        schema = ProductSlideListSchema.parse_obj(content)
+        self.assertEqual(json.loads(schema.json(by_alias=True)), content)
+
+
+if __name__ == "__main__":
+    unittest.main()
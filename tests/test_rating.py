@@ -0,0 +1,65 @@
+# Python imports
+import json
+import unittest
+
+# Beanie imports
+from beanie import PydanticObjectId
+
+# Own imports
+from atheris_api.modules.home.models.rating import RatingModel, RatingSummaryModel
+from atheris_api.modules.home.schemas.rating import RatingListSchema, RatingSetSchema
+from atheris_api.modules.home.services.rating import RatingRequest
+from atheris_api.modules.product.models.product import CustomerModel
+from atheris_api.modules.product.services.product import ProductRequest
+from atheris_api.modules.product.utils.events import get_track_broker
+from . import MongoTestCase
+
+
+class RatingTestCase(MongoTestCase):
+    async def create_rating(self, owner: PydanticObjectId, qualification: float):
+        await RatingModel.create_async(
+            rating=RatingSetSchema(
+                comment="muy buena calidad", qualification=qualification, owner=owner
+            )
+        )
+
+    async def test_summary(self):
+        await self.create_rating(owner=PydanticObjectId(), qualification=5)
+        await self.create_rating(owner=PydanticObjectId(), qualification=3.6)
+        summary = await RatingSummaryModel.get_or_empty_async()
+        self.assertEqual(summary.ratings_count, 2)
+        self.assertAlmostEqual(summary.average, 4.3)
+        self.assertEqual(summary.histogram, {"5": 1, "4": 1})
+
+    async def test_list_matches_schema(self):
+        await self.create_rating(owner=PydanticObjectId(), qualification=4)
+        response = await RatingRequest().get_async(count=False)
+        content = json.loads(response.body)
+        self.assertEqual(
+            set(content["results"][0]), {"_id", "comment", "qualification", "average"}
+        )
+        # The raw rows are what the declared response_model would serialize.
+        schema = RatingListSchema.parse_obj(content)
+        self.assertEqual(json.loads(schema.json(by_alias=True)), content)
+
+    async def test_rating_invalidates_track(self):
+        track = PydanticObjectId()
+        await CustomerModel.get_motor_collection().insert_one(
+            {"_id": track, "status": False}
+        )
+        first = await ProductRequest().get_track_async(track=track)
+        await self.create_rating(owner=track, qualification=4)
+        second = await ProductRequest().get_track_async(track=track)
+        self.assertFalse(json.loads(first.body)["rating"])
+        self.assertEqual(second.headers["X-Cache"], "MISS")
+        self.assertTrue(json.loads(second.body)["rating"])
+
+    async def test_rating_notifies_track_events(self):
+        track = PydanticObjectId()
+        with get_track_broker().subscribe(track) as queue:
+            await self.create_rating(owner=track, qualification=4)
+            self.assertEqual(queue.get_nowait(), track)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+# Python imports
+import unittest
+
+# Own imports
+from atheris_api.modules.file.utils.response import (
+    CACHE_CONTROL_IMMUTABLE,
+    accel_redirect_response,
+)
+
+
+class AccelRedirectTestCase(unittest.TestCase):
+    def test_keeps_validator_and_cache_headers(self):
+        # nginx.conf adds these back on the internal location, since nginx does
+        # not forward upstream headers on an X-Accel-Redirect.
+        response = accel_redirect_response(
+            path="/atheris/uploads/slides/ab/cd/abcd.png",
+            root="/atheris/uploads",
+            prefix="/protected_uploads/",
+            headers={
+                "ETag": '"abcd"',
+                "Cache-Control": CACHE_CONTROL_IMMUTABLE,
+                "Vary": "Accept",
+            },
+        )
+        self.assertEqual(
+            response.headers["x-accel-redirect"],
+            "/protected_uploads/slides/ab/cd/abcd.png",
+        )
+        self.assertEqual(response.headers["etag"], '"abcd"')
+        self.assertEqual(response.headers["vary"], "Accept")
+        self.assertEqual(response.headers["cache-control"], CACHE_CONTROL_IMMUTABLE)
+        self.assertEqual(response.body, b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# Python imports
+import json
+import unittest
+from unittest.mock import AsyncMock, patch
+
+# Beanie imports
+from beanie import PydanticObjectId
+
+# Own imports
+from atheris_api.modules.home.models.rating import RatingModel
+from atheris_api.modules.product.models.product import CustomerModel, ProductModel
+from atheris_api.modules.product.services.product import ProductRequest
+from atheris_api.modules.product.utils.events import notify_track_changed
+from atheris_api.modules.product.utils.track import get_track_cache
+
+
+class FakeCursor:
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def to_list(self, length=None):
+        return self.documents[:length] if length else self.documents
+
+
+class FakeCollection:
+    """
+    The subset of a Motor collection the tracking queries use. find_one
+    matches top-level fields by equality and aggregate returns a fixed result.
+    """
+
+    def __init__(self, documents=(), aggregated=()):
+        self.documents = list(documents)
+        self.aggregated = list(aggregated)
+
+    async def find_one(self, query, projection=None):
+        for document in self.documents:
+            if all(document.get(key) == value for key, value in query.items()):
+                return document
+        return None
+
+    def aggregate(self, pipeline):
+        return FakeCursor(self.aggregated)
+
+
+class TrackTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        get_track_cache.cache_clear()
+        self.track = PydanticObjectId()
+
+    async def get_track(self, customers=(), progress=(), ratings=()):
+        with patch.object(
+            CustomerModel,
+            "get_motor_collection",
+            return_value=FakeCollection(customers),
+        ), patch.object(
+            ProductModel,
+            "get_motor_collection",
+            return_value=FakeCollection(aggregated=progress),
+        ), patch.object(
+            RatingModel, "get_motor_collection", return_value=FakeCollection(ratings)
+        ):
+            response = await ProductRequest().get_track_async(track=self.track)
+        return response, json.loads(response.body)
+
+    async def test_unknown_customer(self):
+        response, content = await self.get_track()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            content, {"total": 0, "ready": 0, "status": 0, "rating": False}
+        )
+
+    async def test_products_in_progress(self):
+        _, content = await self.get_track(
+            customers=[{"_id": self.track, "status": False}],
+            progress=[{"_id": None, "total": 3, "ready": 1}],
+        )
+        self.assertEqual(
+            content, {"total": 3, "ready": 1, "status": 1, "rating": False}
+        )
+
+    async def test_products_ready_and_rated(self):
+        _, content = await self.get_track(
+            customers=[{"_id": self.track, "status": False}],
+            progress=[{"_id": None, "total": 2, "ready": 2}],
+            ratings=[{"_id": PydanticObjectId(), "owner": self.track}],
+        )
+        self.assertEqual(content, {"total": 2, "ready": 2, "status": 2, "rating": True})
+
+    async def test_delivered_order(self):
+        _, content = await self.get_track(
+            customers=[{"_id": self.track, "status": True}],
+            progress=[{"_id": None, "total": 2, "ready": 2}],
+        )
+        self.assertEqual(content["status"], 3)
+
+    async def test_cached_answer(self):
+        first, _ = await self.get_track(
+            customers=[{"_id": self.track, "status": False}],
+            progress=[{"_id": None, "total": 1, "ready": 0}],
+        )
+        second, content = await self.get_track()
+        self.assertEqual(first.headers["X-Cache"], "MISS")
+        self.assertEqual(second.headers["X-Cache"], "HIT")
+        self.assertEqual(content["total"], 1)
+
+
+class TrackEventsTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        get_track_cache.cache_clear()
+        self.track = PydanticObjectId()
+
+    @patch("atheris_api.modules.product.services.product.TRACK_EVENTS_KEEP_ALIVE", 0.01)
+    async def test_idle_stream_does_not_query(self):
+        answers = [
+            {"total": 1, "ready": 0, "status": 1, "rating": False},
+            {"total": 1, "ready": 1, "status": 2, "rating": False},
+        ]
+        with patch.object(
+            ProductRequest,
+            "_get_track_information_async",
+            AsyncMock(side_effect=answers),
+        ) as get_track_information:
+            events = ProductRequest()._stream_track_events_async(self.track)
+            first = await events.__anext__()
+            # Expire the cached answer, as the TTL would on a long idle stream.
+            get_track_cache.cache_clear()
+            self.assertEqual(await events.__anext__(), ": keep-alive\n\n")
+            self.assertEqual(await events.__anext__(), ": keep-alive\n\n")
+            self.assertEqual(get_track_information.await_count, 1)
+            notify_track_changed(self.track)
+            second = await events.__anext__()
+            await events.aclose()
+        self.assertIn('"status": 1', first)
+        self.assertIn('"status": 2', second)
+        self.assertEqual(get_track_information.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
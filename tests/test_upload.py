@@ -0,0 +1,38 @@
+# Python imports
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+# Own imports
+from atheris_api.modules.file.models.file import FileModel
+from atheris_api.modules.file.models.upload import UploadSessionModel
+from atheris_api.modules.file.services import upload
+from atheris_api.modules.file.services.upload import UploadSessionRequest
+from . import MongoTestCase
+
+
+class UploadSessionTestCase(MongoTestCase):
+    async def test_commit_already_uploaded_content(self):
+        sha256 = hashlib.sha256(b"banner").hexdigest()
+        md5 = hashlib.md5(sha256.encode()).hexdigest()
+        await FileModel.insert_one(FileModel(sha256=sha256, md5=md5, ext=".png"))
+        upload_session = await UploadSessionModel.insert_one(
+            UploadSessionModel(filename="banner.png", content_type="image/png", size=6)
+        )
+        staging_fd, staging_path = tempfile.mkstemp()
+        os.close(staging_fd)
+        with patch.object(
+            upload, "assemble_async", AsyncMock(return_value=(staging_path, sha256))
+        ):
+            response = await UploadSessionRequest().commit_session_async(
+                session=upload_session.id
+            )
+        self.assertEqual(response, {"upload_dir": md5})
+        self.assertFalse(os.path.exists(staging_path))
+        self.assertIsNone(await UploadSessionModel.get(upload_session.id))
+
+
+if __name__ == "__main__":
+    unittest.main()